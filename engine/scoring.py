@@ -190,6 +190,21 @@ class ScoringEngine(QObject):
         self.state = MatchState.SETUP
         self._emit_score_update()
 
+    def configure_toss(self, winner: str, choice: str) -> None:
+        """
+        Record the coin toss result.
+
+        Args:
+            winner: "player1"/"player2" (1v1) or "home"/"away" (team mode)
+            choice: Stance picked by the toss winner, "opa" or "oshi"
+        """
+        if winner not in ("player1", "player2", "home", "away"):
+            raise ValueError(f"Invalid toss winner: {winner}")
+        if choice not in ("opa", "oshi"):
+            raise ValueError(f"Invalid toss choice: {choice}")
+        self._toss_winner = winner
+        self._toss_choice = choice
+
     def start_match(self) -> None:
         """Start the match (transitions from SETUP to MATCH_ACTIVE)."""
         if self.state != MatchState.SETUP:
@@ -126,6 +126,9 @@ class TournamentBracket(QObject):
     def __init__(self, tournament_id: Optional[int] = None):
         super().__init__()
         self.tournament_id = tournament_id
+        # Set while the initial record is being created elsewhere (e.g. on a
+        # worker thread); save_to_db refuses to run until the ID is known
+        self.save_pending = False
         self.current_stage = TournamentStage.GROUP_STAGE
 
         # Group stage data
@@ -875,7 +878,14 @@ class TournamentBracket(QObject):
 
         Returns:
             Tournament database ID
+
+        Raises:
+            RuntimeError: If the initial record is still being created
         """
+        if self.save_pending:
+            # Without the pending ID this would create a second record
+            raise RuntimeError("Tournament is still being saved")
+
         from models.tournament import Tournament as TournamentModel
 
         if self.tournament_id:
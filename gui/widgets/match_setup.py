@@ -9,15 +9,21 @@ Multi-step form for configuring a new match:
 5. Toss
 """
 
-from typing import Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Callable, Optional, TYPE_CHECKING
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QLineEdit, QSpinBox, QComboBox,
     QGroupBox, QRadioButton, QButtonGroup, QStackedWidget,
-    QFormLayout, QMessageBox, QFrame, QScrollArea
+    QFormLayout, QMessageBox, QFrame,
+    QTableView, QHeaderView, QStyledItemDelegate, QListView, QStyleOptionViewItem
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt, Signal, QEvent, QTimer, QSignalBlocker, QAbstractTableModel, QModelIndex, QRect,
+    QObject, QRunnable, QThreadPool
+)
+from PySide6.QtGui import QStandardItemModel, QStandardItem, QColor, QFont
 
 from services.event_bus import EventBus
 from models.match import GameMode
@@ -30,28 +36,405 @@ if TYPE_CHECKING:
     from gui.main_window import MainWindow
 
 # Default player names for Team vs Team testing (15 per roster)
-_DEFAULT_ROSTER_NAMES = [
+_DEFAULT_ROSTER_NAMES: tuple[str, ...] = (
     "Kofi", "Ama", "Yaw", "Abena", "Kwame", "Akua", "Kweku",
     "Adwoa", "Kojo", "Afia", "Yaa", "Kwesi", "Akosua", "Esi", "Kofi J.",
-]
+)
+assert len(_DEFAULT_ROSTER_NAMES) == 15, "one default name per box"
+
+# Per-side roster defaults and roster/tournament row labels, formatted once at import
+_HOME_DEFAULTS = tuple(f"H-{name}" for name in _DEFAULT_ROSTER_NAMES)
+_AWAY_DEFAULTS = tuple(f"A-{name}" for name in _DEFAULT_ROSTER_NAMES)
+_DEFAULT_JERSEYS = tuple(range(1, 16))
+_BOX_LABELS = tuple(f"Box {i + 1:2d}" for i in range(15))
+_SEED_LABELS = tuple(f"#{i + 1:2d}" for i in range(16))
+_TEAM_PLACEHOLDERS = tuple(f"Team {i + 1} name" for i in range(16))
+
+# Default team names for Tournament testing, in seed order
+_DEFAULT_TOURNAMENT_TEAMS = (
+    "Lions FC", "Eagles United", "Thunder SC", "Phoenix FC",
+    "Dragons AC", "Wolves FC", "Tigers SC", "Panthers United",
+    "Hawks FC", "Falcons SC", "Cobras United", "Vipers FC",
+    "Sharks SC", "Dolphins FC", "Stallions United", "Bulls FC",
+)
+
+# Officials assigned in step 4, as (key, row label, placeholder)
+_OFFICIAL_FIELDS = (
+    ("master", "Master Ampfre:", "Master Ampfre name"),
+    ("caller", "Caller Ampfre:", "Caller Ampfre name"),
+    ("recorder1", "Recorder 1:", "Recorder 1 name"),
+    ("recorder2", "Recorder 2:", "Recorder 2 name"),
+    ("timer", "Timer:", "Timer name"),
+    ("counter", "Counter:", "Counter name"),
+)
+
+# Display names for each game mode in the step 5 summary
+_MODE_NAMES = {
+    GameMode.ONE_VS_ONE: "1 vs 1",
+    GameMode.TEAM_VS_TEAM: "Team vs Team",
+    GameMode.TOURNAMENT: "Tournament",
+}
+
+# Engine toss values by button-group id (0 = first button, 1 = second)
+_TOSS_WINNERS = {
+    GameMode.ONE_VS_ONE: ("player1", "player2"),
+    GameMode.TEAM_VS_TEAM: ("home", "away"),
+}
+_TOSS_CHOICES = ("opa", "oshi")
+
+# Age category combo entries as (label, category), enumerated once at import
+_AGE_CATEGORIES = [(cat.value, cat) for cat in AgeCategory]
+
+
+# Mode card styles. Each card's sheet is parsed once when the card is built;
+# selection only flips the "selected" dynamic property (see _apply_mode_visual)
+_CARD_STYLE_DEFAULT = """
+    QFrame {
+        background-color: #1C1C28;
+        border: 2px solid #3A3A4C;
+        border-radius: 12px;
+    }
+    QFrame:hover {
+        border-color: #4A4A5E;
+    }
+"""
+_CARD_STYLE_SELECTED = """
+    QFrame[selected="true"] {
+        background-color: #222230;
+        border: 3px solid #E8B923;
+    }
+"""
+_CARD_STYLE_BASE = _CARD_STYLE_DEFAULT + _CARD_STYLE_SELECTED
+_CARD_STYLE_DISABLED = """
+    QFrame {
+        background-color: #12121A;
+        border: 2px solid #2A2A38;
+        border-radius: 12px;
+    }
+"""
+
+
+# Static informational frames (format notes in step 2, toss instructions in step 5)
+_FORMAT_FRAME_CSS = """
+    QFrame {
+        background-color: #1C1C28;
+        border: 2px solid #E8B923;
+        border-radius: 8px;
+        padding: 15px;
+    }
+"""
+_INSTRUCTION_FRAME_CSS = """
+    QFrame {
+        background-color: #1A2744;
+        border: 2px solid #E8B923;
+        border-radius: 8px;
+        padding: 10px;
+    }
+"""
+_TEAM_FORMAT_DETAILS_TEXT = (
+    "• 3 Games per match\n"
+    "• 15 Rounds per game\n"
+    "• 15 Players per team\n"
+    "• Max 5 substitutions per match\n"
+    "• Round winner eliminates 1 opponent (+3 AP)\n"
+    "• Endgame bonuses: +5/+10/+15 AP"
+)
+_TOURNAMENT_FORMAT_DETAILS_TEXT = (
+    "• 16 Teams required\n"
+    "• 4 Groups of 4 teams each\n"
+    "• Round-robin group stage\n"
+    "• Top 2 from each group advance\n"
+    "• Knockout: R16 → QF → SF → Final\n"
+    "• Head-to-head tiebreakers applied"
+)
+_INSTRUCTION_TEXT = (
+    "The Master Ampfre must conduct the coin toss on the court before proceeding.\n"
+    "After the toss is complete, record the result below."
+)
+
+
+def _build_format_frame(title: str, details: str) -> QFrame:
+    """Build a gold-bordered format info frame with a title and bullet details."""
+    frame = QFrame()
+    frame.setStyleSheet(_FORMAT_FRAME_CSS)
+    inner = QVBoxLayout(frame)
+
+    title_label = QLabel(title)
+    title_label.setStyleSheet("font-size: 12pt; font-weight: bold; color: #E8B923;")
+    inner.addWidget(title_label)
+
+    details_label = QLabel(details)
+    details_label.setStyleSheet("font-size: 10pt; color: #A0A0B0;")
+    inner.addWidget(details_label)
+
+    return frame
+
+
+def _build_instruction_frame() -> QFrame:
+    """Build the "conduct toss now" instruction frame."""
+    frame = QFrame()
+    frame.setStyleSheet(_INSTRUCTION_FRAME_CSS)
+    inner = QVBoxLayout(frame)
+
+    heading = QLabel("CONDUCT TOSS NOW")
+    heading.setStyleSheet("font-size: 12pt; font-weight: bold; color: #E8B923;")
+    heading.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    inner.addWidget(heading)
+
+    text = QLabel(_INSTRUCTION_TEXT)
+    text.setStyleSheet("font-size: 10pt; color: #A0A0B0;")
+    text.setWordWrap(True)
+    text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    inner.addWidget(text)
+
+    return frame
+
+
+@lru_cache(maxsize=64)
+def _players_step_error(mode: GameMode, inputs: tuple) -> Optional[tuple[str, str]]:
+    """
+    Check the players/teams step, returning a (title, message) warning or None.
+
+    inputs is the mode's entered values: the 16 team names (tournament),
+    (home name, away name, home count, away count) (team), or the two
+    player names (1v1). Results are cached, so re-clicking Next with
+    unchanged inputs skips the checks.
+    """
+    if mode == GameMode.TOURNAMENT:
+        filled_teams = [name for name in inputs if name]
+        if len(filled_teams) < 16:
+            return (
+                "Incomplete Teams",
+                f"Tournament requires 16 teams.\n\n"
+                f"Currently entered: {len(filled_teams)}/16 teams"
+            )
+        # Check for duplicate names
+        if len(filled_teams) != len(set(filled_teams)):
+            return "Duplicate Names", "Each team must have a unique name."
+    elif mode == GameMode.TEAM_VS_TEAM:
+        home_name, away_name, home_count, away_count = inputs
+        if not home_name or not away_name:
+            return "Missing Information", "Please enter names for both teams."
+        if home_count < 15 or away_count < 15:
+            return (
+                "Incomplete Rosters",
+                f"Each team requires 15 players.\n\n"
+                f"Home team: {home_count}/15 players\n"
+                f"Away team: {away_count}/15 players"
+            )
+    else:
+        p1_name, p2_name = inputs
+        if not p1_name or not p2_name:
+            return "Missing Information", "Please enter names for both players."
+    return None
+
+
+class _TournamentSaveSignals(QObject):
+    """
+    Result signals for _SaveTournamentRunnable.
+
+    Created on the GUI thread, so emissions from the pool thread are
+    queued back to the wizard's slots. Each result carries the bracket
+    that was saved, so it reaches that bracket even if another
+    tournament has been started since.
+    """
+
+    save_succeeded = Signal(object, int)  # TournamentBracket, tournament ID
+    save_failed = Signal(object, str)  # TournamentBracket, error message
+
+
+class _SaveTournamentRunnable(QRunnable):
+    """
+    Persist a tournament record on a QThreadPool thread.
+
+    values is a snapshot of the record's column values (strings and
+    scalars, with the bracket state already serialized to JSON) taken on
+    the GUI thread. The worker builds its own record from it and only
+    hands the bracket back through the result signals.
+    """
+
+    def __init__(self, bracket: TournamentBracket, values: dict,
+                 signals: _TournamentSaveSignals):
+        super().__init__()
+        self.bracket = bracket
+        self.values = values
+        self.signals = signals
+
+    def run(self) -> None:
+        from models.tournament import Tournament as TournamentModel
+
+        try:
+            with get_session() as session:
+                tournament = TournamentModel(**self.values)
+                session.add(tournament)
+                session.flush()
+                tournament_id = tournament.id
+        except Exception as e:
+            self.signals.save_failed.emit(self.bracket, str(e))
+            return
+        self.signals.save_succeeded.emit(self.bracket, tournament_id)
+
+
+class RosterTableModel(QAbstractTableModel):
+    """
+    Table model holding a team roster: one row per box with the player name
+    and jersey number, stored as two plain lists.
+    """
+
+    NAME_COLUMN = 0
+    JERSEY_COLUMN = 1
+    _HEADERS = ("Player Name", "Jersey #")
+
+    def __init__(self, names: list[str], jerseys: list[int], parent=None):
+        super().__init__(parent)
+        self._names = list(names)
+        self._jerseys = list(jerseys)
+        self._filled = self._count_filled(self._names)
+
+    @property
+    def names(self) -> list[str]:
+        """Player names by box (read-only view)."""
+        return self._names
+
+    @property
+    def jerseys(self) -> list[int]:
+        """Jersey numbers by box (read-only view)."""
+        return self._jerseys
+
+    @property
+    def filled_count(self) -> int:
+        """Number of boxes with a non-blank name, kept up to date on each edit."""
+        return self._filled
+
+    @staticmethod
+    def _count_filled(names: list[str]) -> int:
+        return sum(1 for name in names if name.strip())
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if index.column() == self.NAME_COLUMN:
+                return self._names[index.row()]
+            return self._jerseys[index.row()]
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        if index.column() == self.NAME_COLUMN:
+            name = str(value)
+            self._filled += bool(name.strip()) - bool(self._names[index.row()].strip())
+            self._names[index.row()] = name
+        else:
+            self._jerseys[index.row()] = int(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._HEADERS[section]
+        return _BOX_LABELS[section]
+
+    def reset_rows(self, names: list[str], jerseys: list[int]) -> None:
+        """Replace every row at once (no-op if the rows already match)."""
+        names, jerseys = list(names), list(jerseys)
+        if names == self._names and jerseys == self._jerseys:
+            return
+        self.beginResetModel()
+        self._names = names
+        self._jerseys = jerseys
+        self._filled = self._count_filled(names)
+        self.endResetModel()
+
+
+class JerseyDelegate(QStyledItemDelegate):
+    """Edits jersey numbers with a QSpinBox created only while editing."""
+
+    def createEditor(self, parent: QWidget, option, index: QModelIndex) -> QWidget:
+        editor = QSpinBox(parent)
+        editor.setRange(1, 99)
+        editor.setFrame(False)
+        return editor
+
+    def setEditorData(self, editor: QSpinBox, index: QModelIndex) -> None:
+        editor.setValue(int(index.data(Qt.ItemDataRole.EditRole)))
+
+    def setModelData(self, editor: QSpinBox, model, index: QModelIndex) -> None:
+        editor.interpretText()  # Commit a typed value not yet confirmed with Enter
+        model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
+
+
+class SeedDelegate(QStyledItemDelegate):
+    """Paints a tournament team row with its "#NN" seed ahead of the editable name."""
+
+    SEED_WIDTH = 40
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        rect = option.rect
+        painter.save()
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("#E8B923"))
+        painter.drawText(
+            QRect(rect.x(), rect.y(), self.SEED_WIDTH, rect.height()),
+            Qt.AlignmentFlag.AlignCenter,
+            _SEED_LABELS[index.row()],
+        )
+        painter.restore()
+
+        name_option = QStyleOptionViewItem(option)
+        name_option.rect = rect.adjusted(self.SEED_WIDTH, 0, 0, 0)
+        super().paint(painter, name_option, index)
+
+    def createEditor(self, parent: QWidget, option, index: QModelIndex) -> QWidget:
+        editor = super().createEditor(parent, option, index)
+        if isinstance(editor, QLineEdit):
+            editor.setPlaceholderText(_TEAM_PLACEHOLDERS[index.row()])
+        return editor
+
+    def updateEditorGeometry(self, editor: QWidget, option, index: QModelIndex) -> None:
+        editor.setGeometry(option.rect.adjusted(self.SEED_WIDTH, 0, 0, 0))
 
 
 class TeamRosterWidget(QWidget):
     """
     Widget for entering a team's roster of 15 players.
-    Shows team name input and a scrollable list of player name/jersey entries.
+    Shows team name input and a table of player name/jersey entries.
     """
 
     def __init__(self, team_label: str = "Team", color: str = "#2196F3", parent=None):
         super().__init__(parent)
         self.team_label = team_label
         self.color = color
-        self.player_entries: list[tuple[QLineEdit, QSpinBox]] = []
+        # Default test names for this side (15 per team; prefix by side)
+        self._defaults = _HOME_DEFAULTS if "Home" in team_label else _AWAY_DEFAULTS
+
+        # Filled roster, cached until the model changes
+        self._snapshot_cache: Optional[list[tuple[int, str]]] = None
 
         self._build_ui()
 
     def _build_ui(self) -> None:
         """Build the roster entry UI."""
+        # Hold repaints until the whole roster is assembled
+        self.setUpdatesEnabled(False)
+
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
 
@@ -67,94 +450,83 @@ class TeamRosterWidget(QWidget):
         team_form.addRow("Team Name:", self.team_name_input)
         layout.addLayout(team_form)
 
-        # Scrollable player list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: 1px solid #333355;
-                border-radius: 8px;
-                background-color: #1C1C28;
-            }
-        """)
-
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setSpacing(5)
-
-        # Default names for testing Team vs Team (15 per team; prefix by side)
-        prefix = "H" if "Home" in self.team_label else "A"
-        default_names = [
-            f"{prefix}-{_DEFAULT_ROSTER_NAMES[i]}" if i < len(_DEFAULT_ROSTER_NAMES) else f"{prefix}-Player {i + 1}"
-            for i in range(15)
-        ]
+        # Player table (pre-filled with default names for testing). Qt only
+        # creates an editor for the cell being edited, not one per row.
+        self.roster_model = RosterTableModel(self._defaults, _DEFAULT_JERSEYS, self)
+        self.roster_model.dataChanged.connect(self._invalidate_snapshot)
+        self.roster_model.modelReset.connect(self._invalidate_snapshot)
 
-        # Create 15 player entry rows
-        for i in range(15):
-            box_num = i + 1
-            row = QHBoxLayout()
-
-            # Box number label
-            box_label = QLabel(f"Box {box_num:2d}:")
-            box_label.setFixedWidth(60)
-            box_label.setStyleSheet("color: #A0A0B0;")
-            row.addWidget(box_label)
-
-            # Player name (pre-filled with default for testing)
-            name_input = QLineEdit()
-            name_input.setPlaceholderText(f"Player {box_num} name")
-            name_input.setText(default_names[i])
-            row.addWidget(name_input)
-
-            # Jersey number
-            jersey_spin = QSpinBox()
-            jersey_spin.setRange(1, 99)
-            jersey_spin.setValue(box_num)
-            jersey_spin.setFixedWidth(60)
-            row.addWidget(jersey_spin)
-
-            self.player_entries.append((name_input, jersey_spin))
-            scroll_layout.addLayout(row)
-
-        scroll_layout.addStretch()
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
+        self.roster_view = QTableView()
+        self.roster_view.setModel(self.roster_model)
+        self.roster_view.setItemDelegateForColumn(
+            RosterTableModel.JERSEY_COLUMN, JerseyDelegate(self.roster_view)
+        )
+        self.roster_view.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.roster_view.setEditTriggers(
+            QTableView.EditTrigger.DoubleClicked
+            | QTableView.EditTrigger.EditKeyPressed
+            | QTableView.EditTrigger.AnyKeyPressed
+        )
+        columns = self.roster_view.horizontalHeader()
+        columns.setSectionResizeMode(RosterTableModel.NAME_COLUMN, QHeaderView.ResizeMode.Stretch)
+        columns.setSectionResizeMode(RosterTableModel.JERSEY_COLUMN, QHeaderView.ResizeMode.Fixed)
+        self.roster_view.setColumnWidth(RosterTableModel.JERSEY_COLUMN, 80)
+        # Uniform fixed-height rows: the view never measures rows for size hints
+        rows = self.roster_view.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(32)
+        # The styled view background fills the whole viewport on every paint,
+        # so Qt can skip erasing it first
+        self.roster_view.viewport().setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        layout.addWidget(self.roster_view)
+
+        self.setUpdatesEnabled(True)
 
     def get_team_name(self) -> str:
         """Get the team name."""
         return self.team_name_input.text().strip()
 
+    def _invalidate_snapshot(self, *_) -> None:
+        """Drop the cached roster after an edit."""
+        self._snapshot_cache = None
+
+    def snapshot(self) -> list[tuple[int, str]]:
+        """
+        Get the filled roster entries in one pass over the model.
+        The result is cached until the roster is edited.
+        """
+        if self._snapshot_cache is None:
+            model = self.roster_model
+            self._snapshot_cache = [
+                (jersey, name)
+                for raw, jersey in zip(model.names, model.jerseys)
+                if (name := raw.strip())
+            ]
+        return self._snapshot_cache
+
     def get_roster(self) -> list[tuple[int, str]]:
         """
         Get the roster as a list of (player_id, player_name) tuples.
         Uses jersey number as player_id.
         """
-        roster = []
-        for name_input, jersey_spin in self.player_entries:
-            name = name_input.text().strip()
-            if name:
-                roster.append((jersey_spin.value(), name))
-        return roster
+        return list(self.snapshot())
 
     def get_filled_count(self) -> int:
         """Get the number of filled player slots."""
-        count = 0
-        for name_input, _ in self.player_entries:
-            if name_input.text().strip():
-                count += 1
-        return count
+        return self.roster_model.filled_count
 
     def clear(self) -> None:
-        """Clear all entries and reset to default test names."""
-        self.team_name_input.clear()
-        prefix = "H" if "Home" in self.team_label else "A"
-        default_names = [
-            f"{prefix}-{_DEFAULT_ROSTER_NAMES[i]}" if i < len(_DEFAULT_ROSTER_NAMES) else f"{prefix}-Player {i + 1}"
-            for i in range(15)
-        ]
-        for i, (name_input, jersey_spin) in enumerate(self.player_entries):
-            name_input.setText(default_names[i])
-            jersey_spin.setValue(i + 1)
+        """Clear all entries and reset to default test names.
+
+        Emits no textChanged for the team name; the roster emits a single
+        modelReset, and only if it differed from the defaults.
+        """
+        self.setUpdatesEnabled(False)
+        if self.team_name_input.text():
+            with QSignalBlocker(self.team_name_input):
+                self.team_name_input.clear()
+        self.roster_model.reset_rows(self._defaults, _DEFAULT_JERSEYS)
+        self.setUpdatesEnabled(True)
 
 
 class MatchSetupWidget(QWidget):
@@ -171,20 +543,65 @@ class MatchSetupWidget(QWidget):
 
     match_ready = Signal(object)  # Emits ScoringEngine when setup complete
 
+    _STEP_NAMES: tuple[str, ...] = (
+        "Select Game Mode",
+        "Match Configuration",
+        "Enter Players",
+        "Assign Officials",
+        "Toss & Start",
+    )
+
+    # Frame for the tournament team list view (theme-aligned)
+    _TEAM_LIST_CSS = """
+        QListView {
+            border: 1px solid #333355;
+            border-radius: 8px;
+            background-color: #1C1C28;
+        }
+    """
+
+    # Step 5 summary layouts, filled by _update_summary via format_map
+    _TEAM_SUMMARY_TMPL = (
+        "Mode: {mode}\n"
+        "Format: 3 Games × 15 Rounds (Shooter Mode)\n"
+        "Age Category: {age}\n"
+        "\n"
+        "Home Team: {home_name} ({home_count} players)\n"
+        "Away Team: {away_name} ({away_count} players)"
+    )
+    _TOURNAMENT_SUMMARY_TMPL = (
+        "Mode: {mode}\n"
+        "Format: 4 Groups → Knockout (R16 → QF → SF → Final)\n"
+        "Age Category: {age}\n"
+        "\n"
+        "Teams: {team_count}/16 registered\n"
+        "Preview: {preview}\n"
+        "\n"
+        "Note: Toss is conducted before each individual match."
+    )
+    _1V1_SUMMARY_TMPL = (
+        "Mode: {mode}\n"
+        "Rounds: {rounds}\n"
+        "Age Category: {age}\n"
+        "\n"
+        "Player 1: {player1}\n"
+        "Player 2: {player2}"
+    )
+
     def __init__(self, event_bus: EventBus, main_window: "MainWindow"):
         super().__init__()
         self.event_bus = event_bus
         self.main_window = main_window
 
+        # Main-window hooks used when a match is started
+        self._set_engine = main_window.set_scoring_engine
+        self._start_scoring = main_window.start_match_scoring
+
         # Setup state
         self.game_mode: Optional[GameMode] = None
         self.total_rounds = 5
         self.age_category: Optional[AgeCategory] = None
 
-        # Player info (1v1 mode)
-        self.player1_name = ""
-        self.player2_name = ""
-
         # Team info (Team vs Team mode)
         self.home_roster_widget: Optional[TeamRosterWidget] = None
         self.away_roster_widget: Optional[TeamRosterWidget] = None
@@ -197,6 +614,18 @@ class MatchSetupWidget(QWidget):
         self.toss_winner = ""
         self.toss_choice = ""
 
+        # Set whenever an input shown in the step 5 summary/toss labels changes
+        self._summary_dirty = True
+        # Inputs the summary label was last rendered from
+        self._last_summary_key: Optional[tuple] = None
+        # (player 1 text, player 2 text, enabled) last applied to the toss buttons
+        self._last_toss_labels: Optional[tuple[str, str, bool]] = None
+
+        # Tournament saves run on the global thread pool; results arrive queued
+        self._save_signals = _TournamentSaveSignals(self)
+        self._save_signals.save_succeeded.connect(self._on_tournament_saved)
+        self._save_signals.save_failed.connect(self._on_tournament_save_failed)
+
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -221,12 +650,19 @@ class MatchSetupWidget(QWidget):
         self.steps = QStackedWidget()
         layout.addWidget(self.steps)
 
-        # Create step widgets
+        # Create step widgets. Only step 1 is built up front; later steps start
+        # as empty placeholders and are built the first time they are entered.
+        self._step_builders = [
+            self._create_step1_game_mode,
+            self._create_step2_config,
+            self._create_step3_players,
+            self._create_step4_officials,
+            self._create_step5_toss,
+        ]
+        self._built: set[int] = {0}
         self.steps.addWidget(self._create_step1_game_mode())
-        self.steps.addWidget(self._create_step2_config())
-        self.steps.addWidget(self._create_step3_players())
-        self.steps.addWidget(self._create_step4_officials())
-        self.steps.addWidget(self._create_step5_toss())
+        for _ in self._step_builders[1:]:
+            self.steps.addWidget(QWidget())
 
         # Navigation buttons
         nav_layout = QHBoxLayout()
@@ -267,6 +703,9 @@ class MatchSetupWidget(QWidget):
         modes_layout.setSpacing(20)
 
         self.mode_group = QButtonGroup(self)
+        self._mode_frames: dict[GameMode, QFrame] = {}
+        self._frame_to_radio: dict[QFrame, QRadioButton] = {}
+        self._selected_frame: Optional[QFrame] = None
 
         # 1v1 Mode
         frame_1v1, btn_1v1 = self._create_mode_card(
@@ -298,6 +737,10 @@ class MatchSetupWidget(QWidget):
         layout.addLayout(modes_layout)
         layout.addStretch()
 
+        # One signal per user selection (toggled would fire for both radios)
+        self.mode_group.buttonClicked.connect(self._on_mode_clicked)
+        self._apply_mode_visual(self.game_mode)
+
         return widget
 
     def _create_mode_card(self, title: str, description: str, mode: GameMode,
@@ -307,25 +750,8 @@ class MatchSetupWidget(QWidget):
         frame.setFixedSize(280, 160)
         frame.setCursor(Qt.CursorShape.PointingHandCursor if enabled else Qt.CursorShape.ForbiddenCursor)
 
-        # Style for the frame (theme-aligned)
-        base_style = """
-            QFrame {
-                background-color: #1C1C28;
-                border: 2px solid #3A3A4C;
-                border-radius: 12px;
-            }
-            QFrame:hover {
-                border-color: #4A4A5E;
-            }
-        """
-        disabled_style = """
-            QFrame {
-                background-color: #12121A;
-                border: 2px solid #2A2A38;
-                border-radius: 12px;
-            }
-        """
-        frame.setStyleSheet(base_style if enabled else disabled_style)
+        frame.setProperty("selected", False)
+        frame.setStyleSheet(_CARD_STYLE_BASE if enabled else _CARD_STYLE_DISABLED)
 
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -335,8 +761,8 @@ class MatchSetupWidget(QWidget):
         radio = QRadioButton()
         radio.setVisible(False)
         radio.setEnabled(enabled)
+        radio.setProperty("mode", mode.value)
         self.mode_group.addButton(radio)
-        radio.toggled.connect(lambda checked, m=mode, f=frame: self._on_mode_toggled(checked, m, f))
         layout.addWidget(radio)
 
         # Title
@@ -354,51 +780,85 @@ class MatchSetupWidget(QWidget):
 
         layout.addStretch()
 
-        # Make frame clickable
+        self._mode_frames[mode] = frame
+
+        # Make frame clickable (handled in eventFilter)
         if enabled:
-            frame.mousePressEvent = lambda e, r=radio: r.setChecked(True)
+            self._frame_to_radio[frame] = radio
+            frame.installEventFilter(self)
 
         return frame, radio
 
-    def _on_mode_toggled(self, checked: bool, mode: GameMode, frame: QFrame) -> None:
-        """Handle mode selection toggle."""
-        if checked:
-            self.game_mode = mode
-            # Update frame style to show selection
-            frame.setStyleSheet("""
-                QFrame {
-                    background-color: #222230;
-                    border: 3px solid #E8B923;
-                    border-radius: 12px;
-                }
-            """)
-        else:
-            # Reset to default style
-            frame.setStyleSheet("""
-                QFrame {
-                    background-color: #1C1C28;
-                    border: 2px solid #3A3A4C;
-                    border-radius: 12px;
-                }
-                QFrame:hover {
-                    border-color: #555577;
-                }
-            """)
+    def eventFilter(self, obj, event) -> bool:
+        """Select a game mode when its card frame is clicked."""
+        if event.type() == QEvent.Type.MouseButtonPress:
+            radio = self._frame_to_radio.get(obj)
+            if radio is not None:
+                radio.click()
+                return True
+        return super().eventFilter(obj, event)
+
+    def _on_mode_clicked(self, button: QRadioButton) -> None:
+        """Handle mode selection (each radio carries its mode as a property)."""
+        mode = GameMode(button.property("mode"))
+        if mode == self.game_mode:
+            return
+
+        self.game_mode = mode
+        self._summary_dirty = True
+        self._apply_mode_visual(mode)
+
+    def _apply_mode_visual(self, mode: GameMode) -> None:
+        """Mark the card for mode as selected, restyling only it and the previous card."""
+        frame = self._mode_frames[mode]
+        previous = self._selected_frame
+        if previous is frame:
+            return
+        if previous is not None:
+            self._set_card_selected(previous, False)
+        self._set_card_selected(frame, True)
+        self._selected_frame = frame
+
+    @staticmethod
+    def _set_card_selected(frame: QFrame, selected: bool) -> None:
+        """Flip a card's selected property and re-polish so its [selected] rule applies."""
+        frame.setProperty("selected", selected)
+        frame.style().unpolish(frame)
+        frame.style().polish(frame)
 
     def _create_step2_config(self) -> QWidget:
         """Step 2: Match Configuration."""
         widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(20)
+        form = QFormLayout(widget)
+        form.setSpacing(15)
 
         label = QLabel("Match Configuration")
-        label.setStyleSheet("font-size: 13pt; font-weight: bold;")
-        layout.addWidget(label)
+        label.setObjectName("step_title")
+        form.addRow(label)
+
+        # Mode-specific configuration; only the page for the chosen mode is
+        # built (see _switch_step2_mode) and built pages are kept for reuse
+        self.step2_container, self._step2_layout = self._create_page_container()
+        self._step2_cache: dict[GameMode, QWidget] = {}
+        self._step2_builders = {
+            GameMode.ONE_VS_ONE: self._create_step2_1v1_page,
+            GameMode.TEAM_VS_TEAM: self._create_step2_team_page,
+            GameMode.TOURNAMENT: self._create_step2_tournament_page,
+        }
+        form.addRow(self.step2_container)
+
+        # Age category (applies to both modes)
+        self.age_combo = QComboBox()
+        for text, cat in _AGE_CATEGORIES:
+            self.age_combo.addItem(text, cat)
+        self.age_combo.setCurrentIndex(2)  # Default to Young Adults (a)
+        self.age_combo.currentIndexChanged.connect(self._mark_summary_dirty)
+        form.addRow("Age Category:", self.age_combo)
 
-        # Stacked widget for mode-specific configuration
-        self.step2_stack = QStackedWidget()
+        return widget
 
-        # Page 0: 1v1 Configuration
+    def _create_step2_1v1_page(self) -> QWidget:
+        """Step 2 page for 1v1: rounds selector."""
         onevsone_widget = QWidget()
         onevsone_layout = QVBoxLayout(onevsone_widget)
         onevsone_form = QFormLayout()
@@ -411,109 +871,64 @@ class MatchSetupWidget(QWidget):
         onevsone_form.addRow("Rounds:", self.rounds_combo)
 
         onevsone_layout.addLayout(onevsone_form)
-        self.step2_stack.addWidget(onevsone_widget)
+        return onevsone_widget
 
-        # Page 1: Team vs Team Configuration (fixed format)
+    def _create_step2_team_page(self) -> QWidget:
+        """Step 2 page for Team vs Team: fixed format info."""
         team_widget = QWidget()
         team_layout = QVBoxLayout(team_widget)
 
         # Fixed format info
-        format_frame = QFrame()
-        format_frame.setStyleSheet("""
-            QFrame {
-                background-color: #1C1C28;
-                border: 2px solid #E8B923;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
-        format_inner = QVBoxLayout(format_frame)
-
-        format_title = QLabel("Shooter Mode Format")
-        format_title.setStyleSheet("font-size: 12pt; font-weight: bold; color: #E8B923;")
-        format_inner.addWidget(format_title)
-
-        format_details = QLabel(
-            "• 3 Games per match\n"
-            "• 15 Rounds per game\n"
-            "• 15 Players per team\n"
-            "• Max 5 substitutions per match\n"
-            "• Round winner eliminates 1 opponent (+3 AP)\n"
-            "• Endgame bonuses: +5/+10/+15 AP"
-        )
-        format_details.setStyleSheet("font-size: 10pt; color: #A0A0B0;")
-        format_inner.addWidget(format_details)
-
+        format_frame = _build_format_frame("Shooter Mode Format", _TEAM_FORMAT_DETAILS_TEXT)
         team_layout.addWidget(format_frame)
         team_layout.addStretch()
-        self.step2_stack.addWidget(team_widget)
+        return team_widget
 
-        # Page 2: Tournament Configuration
+    def _create_step2_tournament_page(self) -> QWidget:
+        """Step 2 page for Tournament: format info."""
         tournament_widget = QWidget()
         tournament_layout = QVBoxLayout(tournament_widget)
 
-        tournament_frame = QFrame()
-        tournament_frame.setStyleSheet("""
-            QFrame {
-                background-color: #1C1C28;
-                border: 2px solid #E8B923;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
-        tournament_inner = QVBoxLayout(tournament_frame)
-
-        tournament_title = QLabel("Tournament Format")
-        tournament_title.setStyleSheet("font-size: 12pt; font-weight: bold; color: #E8B923;")
-        tournament_inner.addWidget(tournament_title)
-
-        tournament_details = QLabel(
-            "• 16 Teams required\n"
-            "• 4 Groups of 4 teams each\n"
-            "• Round-robin group stage\n"
-            "• Top 2 from each group advance\n"
-            "• Knockout: R16 → QF → SF → Final\n"
-            "• Head-to-head tiebreakers applied"
-        )
-        tournament_details.setStyleSheet("font-size: 10pt; color: #A0A0B0;")
-        tournament_inner.addWidget(tournament_details)
-
+        tournament_frame = _build_format_frame("Tournament Format", _TOURNAMENT_FORMAT_DETAILS_TEXT)
         tournament_layout.addWidget(tournament_frame)
         tournament_layout.addStretch()
-        self.step2_stack.addWidget(tournament_widget)
-
-        layout.addWidget(self.step2_stack)
-
-        # Age category (applies to both modes)
-        shared_form = QFormLayout()
-        shared_form.setSpacing(15)
-
-        self.age_combo = QComboBox()
-        for cat in AgeCategory:
-            self.age_combo.addItem(cat.value, cat)
-        self.age_combo.setCurrentIndex(2)  # Default to Young Adults (a)
-        shared_form.addRow("Age Category:", self.age_combo)
-
-        layout.addLayout(shared_form)
-        layout.addStretch()
-
-        return widget
+        return tournament_widget
 
     def _update_rounds(self, index: int) -> None:
         """Update rounds based on combo selection (1v1 mode only)."""
-        rounds_map = {0: 5, 1: 10, 2: 15}
-        self.total_rounds = rounds_map.get(index, 5)
+        # Combo items are 5, 10 and 15 rounds
+        self.total_rounds = 5 * (index + 1) if 0 <= index <= 2 else 5
+        self._summary_dirty = True
+
+    @staticmethod
+    def _create_page_container() -> tuple[QWidget, QVBoxLayout]:
+        """Create an empty container that hosts one mode-specific page at a time."""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return container, layout
+
+    def _show_mode_page(self, layout: QVBoxLayout, cache: dict[GameMode, QWidget],
+                        builders: dict) -> QWidget:
+        """
+        Show the page for the current game mode in a page container.
+        The page is built on first use and cached; other cached pages are hidden.
+        """
+        page = cache.get(self.game_mode)
+        if page is None:
+            page = builders[self.game_mode]()
+            cache[self.game_mode] = page
+            layout.addWidget(page)
+        for other in cache.values():
+            other.setVisible(other is page)
+        return page
 
     def _switch_step2_mode(self) -> None:
         """Switch step 2 UI based on game mode."""
-        if self.game_mode == GameMode.TOURNAMENT:
-            self.step2_stack.setCurrentIndex(2)  # Tournament format info
-            self.total_rounds = 15  # Fixed 15 rounds per game in tournament mode
-        elif self.game_mode == GameMode.TEAM_VS_TEAM:
-            self.step2_stack.setCurrentIndex(1)  # Team format info
-            self.total_rounds = 15  # Fixed 15 rounds per game in team mode
+        self._show_mode_page(self._step2_layout, self._step2_cache, self._step2_builders)
+        if self.game_mode in (GameMode.TOURNAMENT, GameMode.TEAM_VS_TEAM):
+            self.total_rounds = 15  # Fixed 15 rounds per game in team/tournament mode
         else:
-            self.step2_stack.setCurrentIndex(0)  # 1v1 rounds selector
             self._update_rounds(self.rounds_combo.currentIndex())
 
     def _create_step3_players(self) -> QWidget:
@@ -522,29 +937,32 @@ class MatchSetupWidget(QWidget):
         layout = QVBoxLayout(widget)
         layout.setSpacing(10)
 
-        # Stacked widget to switch between 1v1 and team mode
-        self.step3_stack = QStackedWidget()
-        layout.addWidget(self.step3_stack)
-
-        # Page 0: 1v1 Player Entry
-        self.step3_stack.addWidget(self._create_1v1_player_entry())
-
-        # Page 1: Team Roster Entry
-        self.step3_stack.addWidget(self._create_team_roster_entry())
-
-        # Page 2: Tournament Teams Entry
-        self.step3_stack.addWidget(self._create_tournament_teams_entry())
+        # Mode-specific entry page; a 1v1 setup never builds the team rosters
+        self.step3_container, self._step3_layout = self._create_page_container()
+        self._step3_cache: dict[GameMode, QWidget] = {}
+        self._step3_builders = {
+            GameMode.ONE_VS_ONE: self._create_1v1_player_entry,
+            GameMode.TEAM_VS_TEAM: self._create_team_roster_entry,
+            GameMode.TOURNAMENT: self._create_tournament_teams_entry,
+        }
+        self._step3_loading = QLabel("Loading...")
+        self._step3_loading.setObjectName("muted_label")
+        self._step3_loading.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._step3_loading.hide()
+        self._step3_layout.addWidget(self._step3_loading)
+        layout.addWidget(self.step3_container)
 
         return widget
 
     def _create_1v1_player_entry(self) -> QWidget:
         """Create the 1v1 player entry UI."""
         widget = QWidget()
+        widget.setUpdatesEnabled(False)
         layout = QVBoxLayout(widget)
         layout.setSpacing(20)
 
         label = QLabel("Enter Player Information")
-        label.setStyleSheet("font-size: 13pt; font-weight: bold;")
+        label.setObjectName("step_title")
         layout.addWidget(label)
 
         # Two-column layout for players
@@ -554,11 +972,9 @@ class MatchSetupWidget(QWidget):
         # Player 1
         p1_group = QGroupBox("Player 1 / Home")
         p1_layout = QFormLayout(p1_group)
+        p1_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
 
-        self.p1_name = QLineEdit()
-        self.p1_name.setPlaceholderText("Enter player name")
-        self.p1_name.textChanged.connect(lambda t: setattr(self, 'player1_name', t))
-        p1_layout.addRow("Name:", self.p1_name)
+        self._add_line_edit(p1_layout, "Name:", "Enter player name", "p1_name")
 
         self.p1_jersey = QSpinBox()
         self.p1_jersey.setRange(1, 99)
@@ -576,11 +992,9 @@ class MatchSetupWidget(QWidget):
         # Player 2
         p2_group = QGroupBox("Player 2 / Away")
         p2_layout = QFormLayout(p2_group)
+        p2_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
 
-        self.p2_name = QLineEdit()
-        self.p2_name.setPlaceholderText("Enter player name")
-        self.p2_name.textChanged.connect(lambda t: setattr(self, 'player2_name', t))
-        p2_layout.addRow("Name:", self.p2_name)
+        self._add_line_edit(p2_layout, "Name:", "Enter player name", "p2_name")
 
         self.p2_jersey = QSpinBox()
         self.p2_jersey.setRange(1, 99)
@@ -592,6 +1006,7 @@ class MatchSetupWidget(QWidget):
         layout.addLayout(players_layout)
         layout.addStretch()
 
+        widget.setUpdatesEnabled(True)
         return widget
 
     def _create_team_roster_entry(self) -> QWidget:
@@ -603,14 +1018,14 @@ class MatchSetupWidget(QWidget):
         # Header
         header_layout = QHBoxLayout()
         label = QLabel("Enter Team Rosters")
-        label.setStyleSheet("font-size: 13pt; font-weight: bold;")
+        label.setObjectName("step_title")
         header_layout.addWidget(label)
 
         header_layout.addStretch()
 
         # Roster info
         info_label = QLabel("15 players per team required")
-        info_label.setStyleSheet("color: #A0A0B0; font-style: italic;")
+        info_label.setObjectName("muted_label")
         header_layout.addWidget(info_label)
 
         layout.addLayout(header_layout)
@@ -639,6 +1054,10 @@ class MatchSetupWidget(QWidget):
         self.away_roster_widget = TeamRosterWidget("Away Team", "#FF5722")
         teams_layout.addWidget(self.away_roster_widget)
 
+        for roster in (self.home_roster_widget, self.away_roster_widget):
+            roster.team_name_input.textChanged.connect(self._mark_summary_dirty)
+            roster.roster_model.dataChanged.connect(self._mark_summary_dirty)
+
         layout.addLayout(teams_layout)
 
         return widget
@@ -652,125 +1071,91 @@ class MatchSetupWidget(QWidget):
         # Header
         header_layout = QHBoxLayout()
         label = QLabel("Enter Tournament Teams")
-        label.setStyleSheet("font-size: 13pt; font-weight: bold;")
+        label.setObjectName("step_title")
         header_layout.addWidget(label)
 
         header_layout.addStretch()
 
         info_label = QLabel("16 teams required (4 groups × 4 teams)")
-        info_label.setStyleSheet("color: #A0A0B0; font-style: italic;")
+        info_label.setObjectName("muted_label")
         header_layout.addWidget(info_label)
 
         layout.addLayout(header_layout)
 
-        # Scrollable team list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: 1px solid #333355;
-                border-radius: 8px;
-                background-color: #1C1C28;
-            }
-        """)
-
-        scroll_content = QWidget()
-        scroll_layout = QGridLayout(scroll_content)
-        scroll_layout.setSpacing(10)
-
-        # Store team name inputs
-        self.tournament_team_inputs: list[QLineEdit] = []
-
-        # Create 16 team entry rows in a 2-column grid
-        default_team_names = [
-            "Lions FC", "Eagles United", "Thunder SC", "Phoenix FC",
-            "Dragons AC", "Wolves FC", "Tigers SC", "Panthers United",
-            "Hawks FC", "Falcons SC", "Cobras United", "Vipers FC",
-            "Sharks SC", "Dolphins FC", "Stallions United", "Bulls FC"
-        ]
-
-        for i in range(16):
-            row = i % 8
-            col = i // 8
-
-            # Container for each team entry
-            team_container = QHBoxLayout()
-
-            # Seed number
-            seed_label = QLabel(f"#{i + 1:2d}")
-            seed_label.setFixedWidth(30)
-            seed_label.setStyleSheet("color: #E8B923; font-weight: bold;")
-            team_container.addWidget(seed_label)
-
-            # Team name input
-            name_input = QLineEdit()
-            name_input.setPlaceholderText(f"Team {i + 1} name")
-            name_input.setText(default_team_names[i])
-            team_container.addWidget(name_input)
-
-            self.tournament_team_inputs.append(name_input)
-
-            # Add to grid
-            container_widget = QWidget()
-            container_widget.setLayout(team_container)
-            scroll_layout.addWidget(container_widget, row, col)
-
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
+        # Team names in seed order; the list view only creates an editor
+        # for the row being edited and paints the seed via SeedDelegate
+        self.tournament_model = QStandardItemModel(16, 1, self)
+        for i, name in enumerate(_DEFAULT_TOURNAMENT_TEAMS):
+            self.tournament_model.setItem(i, QStandardItem(name))
+        self.tournament_model.dataChanged.connect(self._mark_summary_dirty)
+
+        self.tournament_view = QListView()
+        self.tournament_view.setModel(self.tournament_model)
+        self.tournament_view.setItemDelegate(SeedDelegate(self.tournament_view))
+        self.tournament_view.setUniformItemSizes(True)
+        self.tournament_view.setSpacing(2)
+        self.tournament_view.setEditTriggers(
+            QListView.EditTrigger.DoubleClicked
+            | QListView.EditTrigger.EditKeyPressed
+            | QListView.EditTrigger.AnyKeyPressed
+        )
+        self.tournament_view.setStyleSheet(self._TEAM_LIST_CSS)
+        self.tournament_view.viewport().setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        layout.addWidget(self.tournament_view)
 
         # Group preview
         preview_label = QLabel("Teams will be seeded into 4 groups using serpentine seeding")
-        preview_label.setStyleSheet("color: #A0A0B0; font-style: italic;")
+        preview_label.setObjectName("muted_label")
         layout.addWidget(preview_label)
 
         return widget
 
+    def get_team_names(self) -> list[str]:
+        """Get the entered tournament team names in seed order (stripped; may be empty)."""
+        if not hasattr(self, 'tournament_model'):
+            return []
+        model = self.tournament_model
+        return [model.item(i).text().strip() for i in range(model.rowCount())]
+
     def _create_step4_officials(self) -> QWidget:
         """Step 4: Officials Assignment."""
         widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(20)
-
-        label = QLabel("Assign Officials")
-        label.setStyleSheet("font-size: 13pt; font-weight: bold;")
-        layout.addWidget(label)
-
-        form = QFormLayout()
+        widget.setUpdatesEnabled(False)
+        form = QFormLayout(widget)
+        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
         form.setSpacing(10)
 
-        self.official_master = QLineEdit()
-        self.official_master.setPlaceholderText("Master Ampfre name")
-        form.addRow("Master Ampfre:", self.official_master)
-
-        self.official_caller = QLineEdit()
-        self.official_caller.setPlaceholderText("Caller Ampfre name")
-        form.addRow("Caller Ampfre:", self.official_caller)
-
-        self.official_recorder1 = QLineEdit()
-        self.official_recorder1.setPlaceholderText("Recorder 1 name")
-        form.addRow("Recorder 1:", self.official_recorder1)
-
-        self.official_recorder2 = QLineEdit()
-        self.official_recorder2.setPlaceholderText("Recorder 2 name")
-        form.addRow("Recorder 2:", self.official_recorder2)
-
-        self.official_timer = QLineEdit()
-        self.official_timer.setPlaceholderText("Timer name")
-        form.addRow("Timer:", self.official_timer)
+        label = QLabel("Assign Officials")
+        label.setObjectName("step_title")
+        form.addRow(label)
 
-        self.official_counter = QLineEdit()
-        self.official_counter.setPlaceholderText("Counter name")
-        form.addRow("Counter:", self.official_counter)
+        self.officials: dict[str, QLineEdit] = {}
+        for key, text, placeholder in _OFFICIAL_FIELDS:
+            self.officials[key] = self._add_line_edit(form, text, placeholder)
 
         note = QLabel("(Officials are optional for demo mode)")
-        note.setStyleSheet("color: #666; font-style: italic;")
+        note.setObjectName("note_label")
         form.addRow("", note)
 
-        layout.addLayout(form)
-        layout.addStretch()
-
+        widget.setUpdatesEnabled(True)
         return widget
 
+    def _add_line_edit(self, form: QFormLayout, label: str, placeholder: str,
+                       attr: Optional[str] = None) -> QLineEdit:
+        """Add a labelled line edit row to form, optionally storing it as self.<attr>."""
+        edit = QLineEdit()
+        edit.setPlaceholderText(placeholder)
+        form.addRow(label, edit)
+        if attr:
+            setattr(self, attr, edit)
+        return edit
+
+    def get_officials(self) -> dict[str, str]:
+        """Get the entered official names keyed by role (empty if not assigned)."""
+        if not hasattr(self, 'officials'):
+            return {}
+        return {key: edit.text().strip() for key, edit in self.officials.items()}
+
     def _create_step5_toss(self) -> QWidget:
         """Step 5: Toss Result - Recording the outcome of the physical toss."""
         widget = QWidget()
@@ -779,35 +1164,11 @@ class MatchSetupWidget(QWidget):
 
         # Header
         label = QLabel("Record Toss Result")
-        label.setStyleSheet("font-size: 13pt; font-weight: bold;")
+        label.setObjectName("step_title")
         layout.addWidget(label)
 
         # Instructions - toss must happen physically
-        instruction_frame = QFrame()
-        instruction_frame.setStyleSheet("""
-            QFrame {
-                background-color: #1A2744;
-                border: 2px solid #E8B923;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
-        instruction_layout = QVBoxLayout(instruction_frame)
-
-        instruction_icon = QLabel("CONDUCT TOSS NOW")
-        instruction_icon.setStyleSheet("font-size: 12pt; font-weight: bold; color: #E8B923;")
-        instruction_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        instruction_layout.addWidget(instruction_icon)
-
-        instruction_text = QLabel(
-            "The Master Ampfre must conduct the coin toss on the court before proceeding.\n"
-            "After the toss is complete, record the result below."
-        )
-        instruction_text.setStyleSheet("font-size: 10pt; color: #A0A0B0;")
-        instruction_text.setWordWrap(True)
-        instruction_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        instruction_layout.addWidget(instruction_text)
-
+        instruction_frame = _build_instruction_frame()
         layout.addWidget(instruction_frame)
 
         # Step 1: Record who won the toss
@@ -819,11 +1180,11 @@ class MatchSetupWidget(QWidget):
 
         self.toss_p1 = QRadioButton("Player 1")
         self.toss_p1.setChecked(False)  # No default - Ampfre must explicitly select
-        self.toss_winner_group.addButton(self.toss_p1)
+        self.toss_winner_group.addButton(self.toss_p1, 0)
         winner_layout.addWidget(self.toss_p1)
 
         self.toss_p2 = QRadioButton("Player 2")
-        self.toss_winner_group.addButton(self.toss_p2)
+        self.toss_winner_group.addButton(self.toss_p2, 1)
         winner_layout.addWidget(self.toss_p2)
 
         layout.addWidget(winner_group)
@@ -844,12 +1205,12 @@ class MatchSetupWidget(QWidget):
         self.choice_opa = QRadioButton("OPA (Different Legs)")
         self.choice_opa.setChecked(False)  # No default - Ampfre must explicitly select
         self.choice_opa.setStyleSheet("color: #006B3F; font-weight: bold; font-size: 11pt;")
-        self.toss_choice_group.addButton(self.choice_opa)
+        self.toss_choice_group.addButton(self.choice_opa, 0)
         choice_buttons.addWidget(self.choice_opa)
 
         self.choice_oshi = QRadioButton("OSHI (Same Legs)")
         self.choice_oshi.setStyleSheet("color: #CE1126; font-weight: bold; font-size: 11pt;")
-        self.toss_choice_group.addButton(self.choice_oshi)
+        self.toss_choice_group.addButton(self.choice_oshi, 1)
         choice_buttons.addWidget(self.choice_oshi)
 
         choice_layout.addLayout(choice_buttons)
@@ -884,6 +1245,7 @@ class MatchSetupWidget(QWidget):
         """Go to previous step."""
         current = self.steps.currentIndex()
         if current > 0:
+            self._ensure_step_built(current - 1)
             self.steps.setCurrentIndex(current - 1)
             self._update_navigation()
 
@@ -896,6 +1258,8 @@ class MatchSetupWidget(QWidget):
             return
 
         if current < self.steps.count() - 1:
+            self._ensure_step_built(current + 1)
+
             # Before moving to step 2, switch the config UI based on game mode
             if current == 0:  # About to enter step 2 (match configuration)
                 self._switch_step2_mode()
@@ -904,93 +1268,101 @@ class MatchSetupWidget(QWidget):
             if current == 1:  # About to enter step 3 (players/teams)
                 self._switch_step3_mode()
 
+            # 1v1 names are read when leaving step 3 rather than per keystroke
+            if current == 2:
+                self._summary_dirty = True
+
             self.steps.setCurrentIndex(current + 1)
             self._update_navigation()
 
             # Update summary and toss labels on last step
             if current + 1 == self.steps.count() - 1:
-                self._update_summary()
-                self._update_toss_labels()
+                self._refresh_final_step()
                 # Update button text for tournament mode
                 if self.game_mode == GameMode.TOURNAMENT:
                     self.btn_start.setText("Create Tournament ▶")
                 else:
                     self.btn_start.setText("Start Match ▶")
 
+    def _ensure_step_built(self, index: int) -> None:
+        """Build a wizard step the first time it is navigated to."""
+        if index not in self._built:
+            self._replace_page(self.steps, index, self._step_builders[index]())
+            self._built.add(index)
+
+    @staticmethod
+    def _replace_page(stack: QStackedWidget, index: int, page: QWidget) -> None:
+        """Swap the placeholder at index in stack for the real page."""
+        placeholder = stack.widget(index)
+        stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        stack.insertWidget(index, page)
+
     def _switch_step3_mode(self) -> None:
-        """Switch step 3 UI between 1v1, team, and tournament mode."""
-        if self.game_mode == GameMode.TOURNAMENT:
-            self.step3_stack.setCurrentIndex(2)  # Tournament teams entry
-        elif self.game_mode == GameMode.TEAM_VS_TEAM:
-            self.step3_stack.setCurrentIndex(1)  # Team roster entry
-        else:
-            self.step3_stack.setCurrentIndex(0)  # 1v1 player entry
+        """
+        Switch step 3 UI between 1v1, team, and tournament mode.
+        A team or tournament page that has not been built yet is built on the
+        next event-loop pass, so the step change paints before the build.
+        """
+        if self.game_mode in self._step3_cache or self.game_mode == GameMode.ONE_VS_ONE:
+            self._show_mode_page(self._step3_layout, self._step3_cache, self._step3_builders)
+            return
+
+        for page in self._step3_cache.values():
+            page.hide()
+        self._step3_loading.show()
+        self.btn_next.setEnabled(False)
+        QTimer.singleShot(0, self._finish_step3_page)
+
+    def _finish_step3_page(self) -> None:
+        """Build and show the deferred step 3 page, replacing the loading note."""
+        self._show_mode_page(self._step3_layout, self._step3_cache, self._step3_builders)
+        self._step3_loading.hide()
+        self.btn_next.setEnabled(True)
 
     def _validate_step(self, step: int) -> bool:
         """Validate the current step before proceeding."""
-        if step == 2:  # Players/Teams step
-            if self.game_mode == GameMode.TOURNAMENT:
-                # Validate tournament teams
-                filled_teams = [
-                    inp.text().strip()
-                    for inp in self.tournament_team_inputs
-                    if inp.text().strip()
-                ]
-                if len(filled_teams) < 16:
-                    QMessageBox.warning(
-                        self,
-                        "Incomplete Teams",
-                        f"Tournament requires 16 teams.\n\n"
-                        f"Currently entered: {len(filled_teams)}/16 teams"
-                    )
-                    return False
-                # Check for duplicate names
-                if len(filled_teams) != len(set(filled_teams)):
-                    QMessageBox.warning(
-                        self,
-                        "Duplicate Names",
-                        "Each team must have a unique name."
-                    )
-                    return False
-            elif self.game_mode == GameMode.TEAM_VS_TEAM:
-                # Validate team rosters
-                if not self.home_roster_widget or not self.away_roster_widget:
-                    return False
+        if step != 2:  # Only the Players/Teams step has checks
+            return True
 
-                home_name = self.home_roster_widget.get_team_name()
-                away_name = self.away_roster_widget.get_team_name()
+        if self.game_mode == GameMode.TOURNAMENT:
+            inputs = tuple(self.get_team_names())
+        elif self.game_mode == GameMode.TEAM_VS_TEAM:
+            # Validate team rosters
+            if not self.home_roster_widget or not self.away_roster_widget:
+                return False
+            home, away = self.home_roster_widget, self.away_roster_widget
+            inputs = (home.get_team_name(), away.get_team_name(),
+                      home.get_filled_count(), away.get_filled_count())
+        else:
+            inputs = self._current_1v1_names()
 
-                if not home_name or not away_name:
-                    QMessageBox.warning(
-                        self,
-                        "Missing Information",
-                        "Please enter names for both teams."
-                    )
-                    return False
-
-                home_count = self.home_roster_widget.get_filled_count()
-                away_count = self.away_roster_widget.get_filled_count()
-
-                if home_count < 15 or away_count < 15:
-                    QMessageBox.warning(
-                        self,
-                        "Incomplete Rosters",
-                        f"Each team requires 15 players.\n\n"
-                        f"Home team: {home_count}/15 players\n"
-                        f"Away team: {away_count}/15 players"
-                    )
-                    return False
-            else:
-                # Validate 1v1 players
-                if not self.p1_name.text().strip() or not self.p2_name.text().strip():
-                    QMessageBox.warning(
-                        self,
-                        "Missing Information",
-                        "Please enter names for both players."
-                    )
-                    return False
+        error = _players_step_error(self.game_mode, inputs)
+        if error is not None:
+            QMessageBox.warning(self, *error)
+            return False
         return True
 
+    def _current_1v1_names(self) -> tuple[str, str]:
+        """Get the entered 1v1 player names (stripped; may be empty)."""
+        return self.p1_name.text().strip(), self.p2_name.text().strip()
+
+    def _mark_summary_dirty(self, *_) -> None:
+        """Flag the step 5 summary and toss labels as stale."""
+        self._summary_dirty = True
+
+    def _refresh_final_step(self) -> None:
+        """Rebuild the summary and toss labels only if an input changed since."""
+        if not self._summary_dirty:
+            return
+        # Hold repaints on the toss page so the label updates paint once
+        page = self.steps.widget(4)
+        page.setUpdatesEnabled(False)
+        self._update_summary()
+        self._update_toss_labels()
+        page.setUpdatesEnabled(True)
+        self._summary_dirty = False
+
     def _update_navigation(self) -> None:
         """Update navigation button states."""
         current = self.steps.currentIndex()
@@ -1001,91 +1373,93 @@ class MatchSetupWidget(QWidget):
         self.btn_start.setVisible(current == total - 1)
 
         # Update step indicator
-        step_names = [
-            "Select Game Mode",
-            "Match Configuration",
-            "Enter Players",
-            "Assign Officials",
-            "Toss & Start",
-        ]
-        self.step_indicator.setText(f"Step {current + 1} of {total}: {step_names[current]}")
+        self.step_indicator.setText(f"Step {current + 1} of {total}: {self._STEP_NAMES[current]}")
 
     def _update_summary(self) -> None:
         """Update the match summary display."""
-        mode_names = {
-            GameMode.ONE_VS_ONE: "1 vs 1",
-            GameMode.TEAM_VS_TEAM: "Team vs Team",
-            GameMode.TOURNAMENT: "Tournament",
-        }
-
+        age = self.age_combo.currentText()
         if self.game_mode == GameMode.TOURNAMENT:
-            team_count = sum(1 for inp in self.tournament_team_inputs if inp.text().strip())
-            team_names = [inp.text().strip() for inp in self.tournament_team_inputs[:4] if inp.text().strip()]
+            entered = tuple(self.get_team_names())
+            if self._summary_unchanged((self.game_mode, age, entered)):
+                return
+            team_count = sum(1 for name in entered if name)
+            team_names = [name for name in entered[:4] if name]
             preview = ", ".join(team_names) + "..." if len(team_names) >= 4 else ", ".join(team_names)
 
-            summary = f"""
-Mode: {mode_names.get(self.game_mode, 'Unknown')}
-Format: 4 Groups → Knockout (R16 → QF → SF → Final)
-Age Category: {self.age_combo.currentText()}
-
-Teams: {team_count}/16 registered
-Preview: {preview}
-
-Note: Toss is conducted before each individual match.
-            """
+            summary = self._TOURNAMENT_SUMMARY_TMPL.format_map({
+                "mode": _MODE_NAMES.get(self.game_mode, 'Unknown'),
+                "age": age,
+                "team_count": team_count,
+                "preview": preview,
+            })
         elif self.game_mode == GameMode.TEAM_VS_TEAM:
-            home_name = self.home_roster_widget.get_team_name() if self.home_roster_widget else "Not set"
-            away_name = self.away_roster_widget.get_team_name() if self.away_roster_widget else "Not set"
-            home_count = self.home_roster_widget.get_filled_count() if self.home_roster_widget else 0
-            away_count = self.away_roster_widget.get_filled_count() if self.away_roster_widget else 0
-
-            summary = f"""
-Mode: {mode_names.get(self.game_mode, 'Unknown')}
-Format: 3 Games × 15 Rounds (Shooter Mode)
-Age Category: {self.age_combo.currentText()}
-
-Home Team: {home_name} ({home_count} players)
-Away Team: {away_name} ({away_count} players)
-            """
+            if self.home_roster_widget is None:
+                home_name, home_count = "Not set", 0
+                away_name, away_count = "Not set", 0
+            else:
+                home, away = self.home_roster_widget, self.away_roster_widget
+                home_name, home_count = home.get_team_name(), home.get_filled_count()
+                away_name, away_count = away.get_team_name(), away.get_filled_count()
+            if self._summary_unchanged(
+                (self.game_mode, age, home_name, home_count, away_name, away_count)
+            ):
+                return
+
+            summary = self._TEAM_SUMMARY_TMPL.format_map({
+                "mode": _MODE_NAMES.get(self.game_mode, 'Unknown'),
+                "age": age,
+                "home_name": home_name,
+                "home_count": home_count,
+                "away_name": away_name,
+                "away_count": away_count,
+            })
         else:
-            summary = f"""
-Mode: {mode_names.get(self.game_mode, 'Unknown')}
-Rounds: {self.total_rounds}
-Age Category: {self.age_combo.currentText()}
+            player1, player2 = self._current_1v1_names()
+            player1, player2 = player1 or 'Not set', player2 or 'Not set'
+            if self._summary_unchanged((self.game_mode, age, self.total_rounds, player1, player2)):
+                return
 
-Player 1: {self.p1_name.text() or 'Not set'}
-Player 2: {self.p2_name.text() or 'Not set'}
-            """
-        self.summary_label.setText(summary.strip())
+            summary = self._1V1_SUMMARY_TMPL.format_map({
+                "mode": _MODE_NAMES.get(self.game_mode, 'Unknown'),
+                "rounds": self.total_rounds,
+                "age": age,
+                "player1": player1,
+                "player2": player2,
+            })
+        self.summary_label.setText(summary)
+
+    def _summary_unchanged(self, key: tuple) -> bool:
+        """Check key against the inputs of the last rendered summary, recording it if new."""
+        if key == self._last_summary_key:
+            return True
+        self._last_summary_key = key
+        return False
 
     def _update_toss_labels(self) -> None:
         """Update toss step labels based on game mode."""
         if self.game_mode == GameMode.TOURNAMENT:
             # Tournament mode - toss is per match, not at setup
-            self.toss_p1.setText("N/A (Per-Match)")
-            self.toss_p2.setText("N/A (Per-Match)")
-            self.toss_p1.setEnabled(False)
-            self.toss_p2.setEnabled(False)
-            self.choice_opa.setEnabled(False)
-            self.choice_oshi.setEnabled(False)
+            labels = ("N/A (Per-Match)", "N/A (Per-Match)", False)
         elif self.game_mode == GameMode.TEAM_VS_TEAM:
-            home_name = self.home_roster_widget.get_team_name() if self.home_roster_widget else "Home Team"
-            away_name = self.away_roster_widget.get_team_name() if self.away_roster_widget else "Away Team"
-            self.toss_p1.setText(home_name or "Home Team")
-            self.toss_p2.setText(away_name or "Away Team")
-            self.toss_p1.setEnabled(True)
-            self.toss_p2.setEnabled(True)
-            self.choice_opa.setEnabled(True)
-            self.choice_oshi.setEnabled(True)
+            if self.home_roster_widget is None:
+                home_name = away_name = ""
+            else:
+                home_name = self.home_roster_widget.get_team_name()
+                away_name = self.away_roster_widget.get_team_name()
+            labels = (home_name or "Home Team", away_name or "Away Team", True)
         else:
-            p1_name = self.p1_name.text().strip() or "Player 1"
-            p2_name = self.p2_name.text().strip() or "Player 2"
-            self.toss_p1.setText(p1_name)
-            self.toss_p2.setText(p2_name)
-            self.toss_p1.setEnabled(True)
-            self.toss_p2.setEnabled(True)
-            self.choice_opa.setEnabled(True)
-            self.choice_oshi.setEnabled(True)
+            p1_name, p2_name = self._current_1v1_names()
+            labels = (p1_name or "Player 1", p2_name or "Player 2", True)
+
+        # Only touch the six toss widgets when something they show changed
+        if labels == self._last_toss_labels:
+            return
+        self._last_toss_labels = labels
+        p1_text, p2_text, enabled = labels
+        self.toss_p1.setText(p1_text)
+        self.toss_p2.setText(p2_text)
+        for button in (self.toss_p1, self.toss_p2, self.choice_opa, self.choice_oshi):
+            button.setEnabled(enabled)
 
     def _start_match(self) -> None:
         """Create the scoring engine and start the match."""
@@ -1094,11 +1468,13 @@ Player 2: {self.p2_name.text() or 'Not set'}
             self._start_tournament()
             return
 
-        # Validate toss has been recorded (not needed for tournament)
-        toss_winner_selected = self.toss_p1.isChecked() or self.toss_p2.isChecked()
-        toss_choice_selected = self.choice_opa.isChecked() or self.choice_oshi.isChecked()
+        # Read the recorded toss once from the button groups (-1 if unset);
+        # ids follow _TOSS_WINNERS/_TOSS_CHOICES order
+        winner_id = self.toss_winner_group.checkedId()
+        choice_id = self.toss_choice_group.checkedId()
 
-        if not toss_winner_selected:
+        # Validate toss has been recorded (not needed for tournament)
+        if winner_id < 0:
             QMessageBox.warning(
                 self,
                 "Toss Not Recorded",
@@ -1107,7 +1483,7 @@ Player 2: {self.p2_name.text() or 'Not set'}
             )
             return
 
-        if not toss_choice_selected:
+        if choice_id < 0:
             QMessageBox.warning(
                 self,
                 "Choice Not Recorded",
@@ -1118,6 +1494,7 @@ Player 2: {self.p2_name.text() or 'Not set'}
 
         # Create scoring engine
         engine = ScoringEngine(self.game_mode, self.total_rounds)
+        mode_val = self.game_mode.value
 
         if self.game_mode == GameMode.TEAM_VS_TEAM:
             # Team vs Team mode
@@ -1136,12 +1513,11 @@ Player 2: {self.p2_name.text() or 'Not set'}
             )
 
             # Record toss
-            engine._toss_winner = "home" if self.toss_p1.isChecked() else "away"
-            engine._toss_choice = "opa" if self.choice_opa.isChecked() else "oshi"
+            engine.configure_toss(_TOSS_WINNERS[GameMode.TEAM_VS_TEAM][winner_id], _TOSS_CHOICES[choice_id])
 
             # Emit event
-            self.event_bus.match_created.emit({
-                "mode": self.game_mode.value,
+            self._emit_match_created(lambda: {
+                "mode": mode_val,
                 "rounds": self.total_rounds,
                 "home_team": home_name,
                 "away_team": away_name,
@@ -1150,8 +1526,8 @@ Player 2: {self.p2_name.text() or 'Not set'}
             })
         else:
             # 1v1 mode
-            p1_name = self.p1_name.text().strip() or "Player 1"
-            p2_name = self.p2_name.text().strip() or "Player 2"
+            p1_name, p2_name = self._current_1v1_names()
+            p1_name, p2_name = p1_name or "Player 1", p2_name or "Player 2"
 
             engine.setup_1v1_match(
                 player1_id=1,
@@ -1161,33 +1537,47 @@ Player 2: {self.p2_name.text() or 'Not set'}
             )
 
             # Record toss
-            engine._toss_winner = "player1" if self.toss_p1.isChecked() else "player2"
-            engine._toss_choice = "opa" if self.choice_opa.isChecked() else "oshi"
+            engine.configure_toss(_TOSS_WINNERS[GameMode.ONE_VS_ONE][winner_id], _TOSS_CHOICES[choice_id])
 
             # Emit event
-            self.event_bus.match_created.emit({
-                "mode": self.game_mode.value,
+            self._emit_match_created(lambda: {
+                "mode": mode_val,
                 "rounds": self.total_rounds,
                 "player1": p1_name,
                 "player2": p2_name,
             })
 
+        # Hand the engine over on the next event-loop pass so the click
+        # handler returns (and the wizard repaints) before scoring starts
+        self.btn_start.setEnabled(False)
+        QTimer.singleShot(0, lambda: self._launch_engine(engine))
+
+    def _emit_match_created(self, build_payload: Callable[[], dict]) -> None:
+        """Emit match_created, building the payload only if someone is listening."""
+        bus = self.event_bus
+        if bus.has_listeners(bus.match_created):
+            bus.match_created.emit(build_payload())
+
+    def _launch_engine(self, engine: ScoringEngine) -> None:
+        """Wire a configured engine to the main window and start scoring."""
+        self.btn_start.setEnabled(True)
+
         # Wire to main window
-        self.main_window.set_scoring_engine(engine)
+        self._set_engine(engine)
 
         # Start match
         engine.start_match()
 
-        self.main_window.start_match_scoring()
+        self._start_scoring()
 
     def _start_tournament(self) -> None:
         """Create and start a tournament."""
-        # Collect team data
-        teams = []
-        for i, inp in enumerate(self.tournament_team_inputs):
-            name = inp.text().strip()
-            if name:
-                teams.append({"id": i + 1, "name": name})
+        # Collect team data (ids follow seed order)
+        teams = [
+            {"id": i + 1, "name": name}
+            for i, name in enumerate(self.get_team_names())
+            if name
+        ]
 
         if len(teams) != 16:
             QMessageBox.warning(
@@ -1199,6 +1589,7 @@ Player 2: {self.p2_name.text() or 'Not set'}
             return
 
         # Create tournament bracket
+        self.tournament_teams = teams
         self.tournament_bracket = TournamentBracket()
         self.tournament_bracket.initialize_tournament(
             teams=teams,
@@ -1206,56 +1597,73 @@ Player 2: {self.p2_name.text() or 'Not set'}
             teams_per_group=4
         )
 
-        # Save to database
-        try:
-            with get_session() as session:
-                from models.tournament import Tournament as TournamentModel
-
-                # Create tournament record
-                tournament = TournamentModel(
-                    name=f"Tournament {len(teams)} Teams",
-                    num_groups=4,
-                    teams_per_group=4,
-                    team_count=16,
-                )
-                session.add(tournament)
-                session.flush()
+        # Navigate to tournament bracket view right away; the record is
+        # saved in the background and match_created follows once it has an ID.
+        # save_to_db stays blocked until then so the view can't add a duplicate.
+        self.tournament_bracket.save_pending = True
+        self.main_window.set_tournament_bracket(self.tournament_bracket)
+        self.main_window.show_tournament_view()
 
-                # Update bracket with tournament ID
-                self.tournament_bracket.tournament_id = tournament.id
+        from models.tournament import Tournament as TournamentModel
 
-                # Save bracket state
-                tournament.update_from_bracket(self.tournament_bracket)
-                session.commit()
+        tournament = TournamentModel(
+            name=f"Tournament {len(teams)} Teams",
+            num_groups=4,
+            teams_per_group=4,
+            team_count=16,
+        )
+        tournament.update_from_bracket(self.tournament_bracket)
+        # Snapshot the filled-in column values; unset ones keep their defaults
+        values = {
+            column.key: getattr(tournament, column.key)
+            for column in TournamentModel.__table__.columns
+            if getattr(tournament, column.key) is not None
+        }
+        QThreadPool.globalInstance().start(
+            _SaveTournamentRunnable(self.tournament_bracket, values, self._save_signals)
+        )
 
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                "Database Error",
-                f"Failed to save tournament: {e}\n\n"
-                "Tournament will continue without persistence."
-            )
+    def _on_tournament_saved(self, bracket: TournamentBracket, tournament_id: int) -> None:
+        """Record the saved tournament's ID on its bracket and announce it."""
+        bracket.tournament_id = tournament_id
+        bracket.save_pending = False
+        self._announce_tournament(tournament_id)
+
+    def _on_tournament_save_failed(self, bracket: TournamentBracket, error: str) -> None:
+        """Warn that the tournament runs without persistence, then announce it."""
+        bracket.save_pending = False
+        QMessageBox.warning(
+            self,
+            "Database Error",
+            f"Failed to save tournament: {error}\n\n"
+            "Tournament will continue without persistence."
+        )
+        self._announce_tournament(None)
 
-        # Emit event
-        self.event_bus.match_created.emit({
+    def _announce_tournament(self, tournament_id: Optional[int]) -> None:
+        """Emit match_created for the tournament started by _start_tournament."""
+        self._emit_match_created(lambda: {
             "mode": GameMode.TOURNAMENT.value,
-            "tournament_id": self.tournament_bracket.tournament_id,
-            "team_count": len(teams),
+            "tournament_id": tournament_id,
+            "team_count": len(self.tournament_teams),
             "groups": 4,
         })
 
-        # Navigate to tournament bracket view
-        self.main_window.set_tournament_bracket(self.tournament_bracket)
-        self.main_window.show_tournament_view()
-
     def reset(self) -> None:
         """Reset the wizard to initial state."""
         self.steps.setCurrentIndex(0)
 
-        # Reset 1v1 fields
-        self.p1_name.clear()
-        self.p2_name.clear()
-        self.rounds_combo.setCurrentIndex(0)
+        # Field resets run with signals blocked; derived state is refreshed
+        # once at the end instead of once per cleared field
+        # Reset 1v1 fields (only present once their steps have been built)
+        if hasattr(self, 'p1_name'):
+            with QSignalBlocker(self.p1_name), QSignalBlocker(self.p2_name):
+                self.p1_name.clear()
+                self.p2_name.clear()
+        if hasattr(self, 'rounds_combo'):
+            with QSignalBlocker(self.rounds_combo):
+                self.rounds_combo.setCurrentIndex(0)
+            self._update_rounds(0)
 
         # Reset team roster widgets
         if self.home_roster_widget:
@@ -1264,22 +1672,28 @@ Player 2: {self.p2_name.text() or 'Not set'}
             self.away_roster_widget.clear()
 
         # Reset tournament team inputs with default names
-        if hasattr(self, 'tournament_team_inputs'):
-            default_team_names = [
-                "Lions FC", "Eagles United", "Thunder SC", "Phoenix FC",
-                "Dragons AC", "Wolves FC", "Tigers SC", "Panthers United",
-                "Hawks FC", "Falcons SC", "Cobras United", "Vipers FC",
-                "Sharks SC", "Dolphins FC", "Stallions United", "Bulls FC"
-            ]
-            for i, inp in enumerate(self.tournament_team_inputs):
-                inp.setText(default_team_names[i])
+        if hasattr(self, 'tournament_model'):
+            for i, name in enumerate(_DEFAULT_TOURNAMENT_TEAMS):
+                self.tournament_model.item(i).setText(name)
+
+        # Clear the recorded toss; it must be recorded again for the next match
+        if hasattr(self, 'toss_winner_group'):
+            for group in (self.toss_winner_group, self.toss_choice_group):
+                with QSignalBlocker(group):
+                    group.setExclusive(False)
+                    for button in group.buttons():
+                        button.setChecked(False)
+                    group.setExclusive(True)
 
         # Reset tournament state
         self.tournament_bracket = None
         self.tournament_teams = []
 
-        # Reset step stacks to default (1v1 mode)
-        self.step2_stack.setCurrentIndex(0)
-        self.step3_stack.setCurrentIndex(0)
-
+        # The 1v1 summary reads the player name fields, so it can only be
+        # refreshed once that page exists; otherwise it stays dirty until
+        # the toss step is next entered
+        self._summary_dirty = True
+        mode_page_built = self.game_mode != GameMode.ONE_VS_ONE or hasattr(self, 'p1_name')
+        if 4 in self._built and mode_page_built:
+            self._refresh_final_step()
         self._update_navigation()
@@ -4,8 +4,79 @@ Round Timer Widget
 Visual countdown timer display for the Ampfre Console.
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, Slot
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
+from PySide6.QtCore import Qt, Slot, QSize
+from PySide6.QtGui import (
+    QPainter, QFont, QFontMetrics, QColor, QPalette, QStaticText, QTransform
+)
+
+from gui.styles.theme import SURFACE_MAIN
+
+# Base window color, used for palette/painted backgrounds
+_BACKGROUND = QColor(SURFACE_MAIN)
+
+
+class TimerDisplay(QWidget):
+    """
+    Large timer digits painted directly with a cached QStaticText.
+
+    Replaces a stylesheet-driven QLabel: text changes only re-shape the
+    digits, and color changes just swap the pen.
+    """
+
+    # Text color per timer state
+    _COLORS = {
+        "green": QColor("#00CC00"),
+        "orange": QColor("#FFB74D"),
+        "red": QColor("#FF4444"),
+        "paused": QColor("#888888"),
+    }
+
+    def __init__(self, text: str = "01:00", parent=None):
+        super().__init__(parent)
+        self._font = QFont("JetBrains Mono")
+        self._font.setStyleHint(QFont.StyleHint.Monospace)
+        self._font.setPointSize(72)
+        self._font.setBold(True)
+        self._static = QStaticText(text)
+        self._static.setTextFormat(Qt.TextFormat.PlainText)
+        self._static.prepare(QTransform(), self._font)
+        self._color = self._COLORS["green"]
+        # paintEvent fills every pixel, so Qt can skip erasing first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+
+    def sizeHint(self) -> QSize:
+        metrics = QFontMetrics(self._font)
+        return QSize(metrics.horizontalAdvance("00:00"), metrics.height())
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def setText(self, text: str) -> None:
+        """Set the displayed text and schedule a repaint."""
+        self._static.setText(text)
+        self.update()
+
+    def text(self) -> str:
+        return self._static.text()
+
+    def set_state(self, state: str) -> None:
+        """Set the color state ("green", "orange", "red" or "paused")."""
+        self._color = self._COLORS[state]
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), _BACKGROUND)
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        size = self._static.size()
+        x = (self.width() - size.width()) / 2
+        y = (self.height() - size.height()) / 2
+        painter.drawStaticText(int(x), int(y), self._static)
 
 
 class RoundTimerWidget(QWidget):
@@ -18,8 +89,20 @@ class RoundTimerWidget(QWidget):
     - Red: < 10 seconds
     """
 
+    # "MM:SS" text for every whole second up to an hour, indexed by seconds
+    _MMSS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(3601))
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Latest time received while hidden, applied on the next show
+        self._pending_ms: Optional[int] = None
+        # Whether set_paused(True) is in effect; survives a hidden-tick replay
+        self._paused = False
+        # Background comes from the palette rather than a stylesheet rule
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, _BACKGROUND)
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -28,66 +111,92 @@ class RoundTimerWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         # Timer display
-        self.time_label = QLabel("01:00")
-        self.time_label.setObjectName("timer_display")
-        self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.time_label.setStyleSheet("""
-            font-size: 72pt;
-            font-weight: bold;
-            font-family: 'JetBrains Mono', 'Consolas', monospace;
-            color: #00CC00;
-        """)
-        layout.addWidget(self.time_label)
+        self.time_display = TimerDisplay("01:00")
+        self._current_color = "green"
+        layout.addWidget(self.time_display)
 
         # Status label
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.status_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
         self.status_label.setStyleSheet("font-size: 14pt; color: #A0A0B0;")
         layout.addWidget(self.status_label)
 
+        # Last rendered label texts; unchanged ticks skip setText entirely
+        self._last_time_text = "01:00"
+        self._last_status_text = ""
+
     @Slot(int)
     def update_time(self, remaining_ms: int) -> None:
-        """Update the timer display."""
-        minutes = remaining_ms // 60000
-        seconds = (remaining_ms % 60000) // 1000
-        tenths = (remaining_ms % 1000) // 100
+        """Update the timer display (deferred until shown if hidden)."""
+        if not self.isVisible():
+            self._pending_ms = remaining_ms
+            return
+        self._pending_ms = None
+        self._render_time(remaining_ms)
 
+    def _render_time(self, remaining_ms: int) -> None:
+        """Draw the time text and its warning color/status."""
         # Show tenths when under 10 seconds
         if remaining_ms < 10000:
-            self.time_label.setText(f"{seconds}.{tenths}")
+            text = f"{remaining_ms // 1000}.{(remaining_ms % 1000) // 100}"
         else:
-            self.time_label.setText(f"{minutes:02d}:{seconds:02d}")
+            total_seconds = remaining_ms // 1000
+            if total_seconds < len(self._MMSS):
+                text = self._MMSS[total_seconds]
+            else:
+                text = f"{total_seconds // 60:02d}:{total_seconds % 60:02d}"
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self.time_display.setText(text)
 
         # Update color based on time remaining
         if remaining_ms < 10000:
-            self._set_color("#FF4444")  # Red
-            self.status_label.setText("⚠ FINAL SECONDS")
+            self._set_color("red")
+            self._set_status("⚠ FINAL SECONDS")
         elif remaining_ms < 30000:
-            self._set_color("#FFB74D")  # Orange
-            self.status_label.setText("⚡ 30 Second Warning")
+            self._set_color("orange")
+            self._set_status("⚡ 30 Second Warning")
         else:
-            self._set_color("#00CC00")  # Green
-            self.status_label.setText("")
+            self._set_color("green")
+            self._set_status("")
+
+    def showEvent(self, event) -> None:
+        """Apply any time update that arrived while the widget was hidden."""
+        super().showEvent(event)
+        if self._pending_ms is not None:
+            self.update_time(self._pending_ms)
+            # The replayed tick recolors the display; keep a pause set while hidden
+            if self._paused:
+                self.set_paused(True)
+
+    def _set_status(self, text: str) -> None:
+        """Set the status line, skipping the label update if unchanged."""
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.status_label.setText(text)
 
     def _set_color(self, color: str) -> None:
-        """Set the timer text color."""
-        self.time_label.setStyleSheet(f"""
-            font-size: 72pt;
-            font-weight: bold;
-            font-family: 'JetBrains Mono', 'Consolas', monospace;
-            color: {color};
-        """)
+        """Set the timer text color ("green", "orange", "red" or "paused")."""
+        if color == self._current_color:
+            return  # Only push the color to TimerDisplay when it changes
+        self._current_color = color
+        self.time_display.set_state(color)
 
     def set_paused(self, paused: bool) -> None:
         """Show pause state."""
+        self._paused = paused
         if paused:
-            self.status_label.setText("⏸ PAUSED")
-            self._set_color("#888888")
+            self._set_status("⏸ PAUSED")
+            self._set_color("paused")
         else:
-            self.status_label.setText("")
-            self._set_color("#00CC00")
+            self._set_status("")
+            self._set_color("green")
 
     def reset(self, duration_ms: int = 60000) -> None:
-        """Reset to initial state."""
-        self.update_time(duration_ms)
-        self.status_label.setText("")
+        """Reset to initial state (applied immediately, even while hidden)."""
+        self._pending_ms = None
+        self._paused = False
+        self._render_time(duration_ms)
+        self._set_status("")
@@ -4,10 +4,15 @@ Scoreboard Widget
 Compact score display showing current match state.
 """
 
+from dataclasses import replace
+from typing import Optional
+
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame
 from PySide6.QtCore import Qt, Slot
+from PySide6.QtGui import QColor, QPalette
 
 from engine.scoring import ScoreState
+from gui.styles.theme import SURFACE_MAIN
 
 
 class ScoreboardWidget(QWidget):
@@ -21,6 +26,18 @@ class ScoreboardWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Latest state received while hidden, applied on the next show
+        self._pending_state: Optional[ScoreState] = None
+        # Last rendered name and (opa, oshi) stats per player; rarely change
+        self._last_p1_name: Optional[str] = None
+        self._last_p2_name: Optional[str] = None
+        self._last_p1_stats: Optional[tuple[int, int]] = None
+        self._last_p2_stats: Optional[tuple[int, int]] = None
+        # Background comes from the palette rather than a stylesheet rule
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor(SURFACE_MAIN))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -29,36 +46,41 @@ class ScoreboardWidget(QWidget):
         layout.setContentsMargins(10, 10, 10, 10)
 
         # Player 1
-        p1_frame = self._create_player_section("player1")
-        self.p1_name = p1_frame.findChild(QLabel, "name")
-        self.p1_score = p1_frame.findChild(QLabel, "score")
-        self.p1_stats = p1_frame.findChild(QLabel, "stats")
+        p1_frame, self.p1_name, self.p1_score, self.p1_stats = \
+            self._create_player_section("player1")
         layout.addWidget(p1_frame)
 
         # VS / Round info
         center = QVBoxLayout()
 
         self.vs_label = QLabel("VS")
-        self.vs_label.setStyleSheet("font-size: 24pt; font-weight: bold; color: #FCD116;")
+        self.vs_label.setObjectName("scoreboard_vs")
         self.vs_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         center.addWidget(self.vs_label)
 
         self.round_label = QLabel("Round 0/0")
-        self.round_label.setStyleSheet("font-size: 14pt; color: #A0A0B0;")
+        self.round_label.setObjectName("scoreboard_round")
         self.round_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         center.addWidget(self.round_label)
 
         layout.addLayout(center)
 
         # Player 2
-        p2_frame = self._create_player_section("player2")
-        self.p2_name = p2_frame.findChild(QLabel, "name")
-        self.p2_score = p2_frame.findChild(QLabel, "score")
-        self.p2_stats = p2_frame.findChild(QLabel, "stats")
+        p2_frame, self.p2_name, self.p2_score, self.p2_stats = \
+            self._create_player_section("player2")
         layout.addWidget(p2_frame)
 
-    def _create_player_section(self, player_id: str) -> QFrame:
-        """Create a player score section."""
+        # Plain, non-interactive text: setText skips rich-text detection
+        for label in (
+            self.p1_name, self.p1_score, self.p1_stats,
+            self.p2_name, self.p2_score, self.p2_stats,
+            self.vs_label, self.round_label,
+        ):
+            label.setTextFormat(Qt.TextFormat.PlainText)
+            label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+
+    def _create_player_section(self, player_id: str) -> tuple[QFrame, QLabel, QLabel, QLabel]:
+        """Create a player score section, returning (frame, name, score, stats)."""
         frame = QFrame()
         frame.setStyleSheet("""
             QFrame {
@@ -72,42 +94,68 @@ class ScoreboardWidget(QWidget):
         layout.setSpacing(5)
 
         name = QLabel("Player")
-        name.setObjectName("name")
-        name.setStyleSheet("font-size: 14pt; font-weight: bold;")
+        name.setObjectName("scoreboard_name")
         name.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(name)
 
         score = QLabel("0")
-        score.setObjectName("score")
-        score.setStyleSheet("font-size: 36pt; font-weight: bold; color: #FCD116;")
+        score.setObjectName("scoreboard_score")
         score.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(score)
 
         stats = QLabel("O: 0 | S: 0")
-        stats.setObjectName("stats")
-        stats.setStyleSheet("font-size: 11pt; color: #666;")
+        stats.setObjectName("scoreboard_stats")
         stats.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(stats)
 
-        return frame
+        return frame, name, score, stats
 
     @Slot(object)
     def update_score(self, state: ScoreState) -> None:
-        """Update the scoreboard from a ScoreState."""
+        """Update the scoreboard from a ScoreState (deferred until shown if hidden)."""
+        if not self.isVisible():
+            self._pending_state = state
+            return
+        self._pending_state = None
+
         # Player 1
-        self.p1_name.setText(state.player1_name or "Player 1")
-        self.p1_score.setText(str(state.player1_ap))
-        self.p1_stats.setText(f"O: {state.player1_opa_wins} | S: {state.player1_oshi_wins}")
+        p1_name = state.player1_name or "Player 1"
+        if p1_name != self._last_p1_name:
+            self._last_p1_name = p1_name
+            self.p1_name.setText(p1_name)
+        self.p1_score.setNum(state.player1_ap)
+        p1_stats = (state.player1_opa_wins, state.player1_oshi_wins)
+        if p1_stats != self._last_p1_stats:
+            self._last_p1_stats = p1_stats
+            self.p1_stats.setText(f"O: {state.player1_opa_wins} | S: {state.player1_oshi_wins}")
 
         # Player 2
-        self.p2_name.setText(state.player2_name or "Player 2")
-        self.p2_score.setText(str(state.player2_ap))
-        self.p2_stats.setText(f"O: {state.player2_opa_wins} | S: {state.player2_oshi_wins}")
+        p2_name = state.player2_name or "Player 2"
+        if p2_name != self._last_p2_name:
+            self._last_p2_name = p2_name
+            self.p2_name.setText(p2_name)
+        self.p2_score.setNum(state.player2_ap)
+        p2_stats = (state.player2_opa_wins, state.player2_oshi_wins)
+        if p2_stats != self._last_p2_stats:
+            self._last_p2_stats = p2_stats
+            self.p2_stats.setText(f"O: {state.player2_opa_wins} | S: {state.player2_oshi_wins}")
 
         # Round
         self.round_label.setText(f"Round {state.current_round}/{state.total_rounds}")
 
+    def showEvent(self, event) -> None:
+        """Apply any score update that arrived while the widget was hidden."""
+        super().showEvent(event)
+        if self._pending_state is not None:
+            self.update_score(self._pending_state)
+
     def set_player_names(self, p1_name: str, p2_name: str) -> None:
         """Set player names."""
+        if self._pending_state is not None:
+            # Keep a replay on show from restoring the older names
+            self._pending_state = replace(
+                self._pending_state, player1_name=p1_name, player2_name=p2_name
+            )
+        self._last_p1_name, self._last_p2_name = p1_name, p2_name
         self.p1_name.setText(p1_name)
         self.p2_name.setText(p2_name)
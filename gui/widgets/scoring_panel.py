@@ -19,16 +19,19 @@ Keyboard shortcuts:
 - Ctrl+E: End round
 """
 
-from typing import Optional, TYPE_CHECKING
+import html
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import Iterator, Optional, TYPE_CHECKING
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QGroupBox, QRadioButton,
-    QButtonGroup, QListWidget, QListWidgetItem, QMessageBox,
+    QButtonGroup, QPlainTextEdit, QMessageBox,
     QFrame, QSplitter, QDialog, QComboBox, QLineEdit, QFormLayout
 )
-from PySide6.QtCore import Qt, Slot, Signal, QSize
-from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtCore import Qt, Slot, Signal, QSize, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut, QTextCursor
 
 from gui.icons import icon_foul, icon_undo, icon_substitution, icon_size_normal
 
@@ -151,6 +154,7 @@ class ScoringPanel(QWidget):
         self._oshi_player_name = oshi_player_name
         self._update_button_labels()
 
+    @Slot()
     def _record_opa(self) -> None:
         """Record OPA bout - winner is the OPA player."""
         if self._opa_player_id is not None:
@@ -160,6 +164,7 @@ class ScoringPanel(QWidget):
                 "loser_id": self._oshi_player_id,
             })
 
+    @Slot()
     def _record_oshi(self) -> None:
         """Record OSHI bout - winner is the OSHI player."""
         if self._oshi_player_id is not None:
@@ -169,18 +174,22 @@ class ScoringPanel(QWidget):
                 "loser_id": self._opa_player_id,
             })
 
+    @Slot()
     def record_opa(self) -> None:
         """Public method for keyboard shortcut - record OPA."""
         self._record_opa()
 
+    @Slot()
     def record_oshi(self) -> None:
         """Public method for keyboard shortcut - record OSHI."""
         self._record_oshi()
 
+    @Slot()
     def _open_foul_dialog(self) -> None:
         """Open the foul recording dialog."""
         QMessageBox.information(self, "Foul", "Foul recording dialog - coming soon")
 
+    @Slot()
     def _undo_bout(self) -> None:
         """Request undo of last bout - handled by parent ScoringScreen."""
         pass
@@ -297,6 +306,7 @@ class SubstitutionDialog(QDialog):
 
         layout.addLayout(buttons)
 
+    @Slot()
     def _validate_and_accept(self) -> None:
         """Validate inputs and accept dialog."""
         if not self.sub_name.text().strip():
@@ -399,6 +409,19 @@ class ScoringScreen(QWidget):
     This is the main interface during an active match.
     """
 
+    # Keyboard shortcuts as (keys, slot attribute path), parsed once at class load
+    _SHORTCUTS = (
+        (QKeySequence("O"), "scoring_panel.record_opa"),          # Record OPA (instant, one key)
+        (QKeySequence("S"), "scoring_panel.record_oshi"),         # Record OSHI (instant, one key)
+        (QKeySequence("Ctrl+Z"), "_undo_last_bout"),              # Undo
+        (QKeySequence(Qt.Key.Key_Space), "_toggle_pause"),        # Pause/Resume
+        (QKeySequence("F"), "scoring_panel._open_foul_dialog"),   # Foul
+        (QKeySequence("Ctrl+E"), "_end_round"),                   # End round
+    )
+
+    # "MM:SS" text for every whole second up to an hour, indexed by seconds
+    _MMSS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(3601))
+
     def __init__(self, event_bus: EventBus, main_window: "MainWindow"):
         super().__init__()
         self.event_bus = event_bus
@@ -412,9 +435,29 @@ class ScoringScreen(QWidget):
         self._round_start_time: Optional[float] = None
         self._elapsed_timer_id: Optional[int] = None
 
+        # (player 1 ID, player 2 ID) of the active engine, cached for bout handling
+        self._id_pair: tuple[Optional[int], Optional[int]] = (None, None)
+
+        # Timer label zone and text last applied; unchanged ticks skip the label
+        self._timer_zone = "green"
+        self._last_time_str = "01:00"
+
+        # Latest countdown tick, rendered by _flush_timer_label at most every 200ms
+        self._pending_ms: Optional[int] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(200)
+        self._flush_timer.timeout.connect(self._flush_timer_label)
+
+        # Snapshot _update_display last rendered; None forces a full render
+        self._last_state: Optional[ScoreState] = None
+
+        # Bout log lines (HTML) waiting for the next event-loop pass (see _flush_bout_log)
+        self._pending_log_items: list[str] = []
+
         self._build_ui()
         self._setup_shortcuts()
-        self._connect_signals()
+        # The scoring shortcuts only match while focus is inside this screen
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
     def _build_ui(self) -> None:
         """Build the scoring screen UI."""
@@ -433,9 +476,7 @@ class ScoringScreen(QWidget):
 
         self.timer_label = QLabel("01:00")
         self.timer_label.setObjectName("timer_display")
-        self.timer_label.setStyleSheet(
-            "font-size: 32pt; font-weight: bold; font-family: 'JetBrains Mono', monospace; color: #00CC00;"
-        )
+        self.timer_label.setProperty("zone", "green")
         top_bar.addWidget(self.timer_label)
 
         layout.addLayout(top_bar)
@@ -445,10 +486,8 @@ class ScoringScreen(QWidget):
         content.setSpacing(24)
 
         # Player 1 score
-        p1_frame = self._create_player_frame("player1")
-        self.p1_name_label = p1_frame.findChild(QLabel, "player_name")
-        self.p1_score_label = p1_frame.findChild(QLabel, "player_score")
-        self.p1_stats_label = p1_frame.findChild(QLabel, "player_stats")
+        p1_frame, self.p1_name_label, self.p1_score_label, self.p1_stats_label = \
+            self._create_player_frame("player1")
         content.addWidget(p1_frame)
 
         # Center: Bout recording
@@ -462,7 +501,11 @@ class ScoringScreen(QWidget):
         # Bout log
         log_group = QGroupBox("Bout Log")
         log_layout = QVBoxLayout(log_group)
-        self.bout_log = QListWidget()
+        # Append-only, newest bout last; old lines are dropped past 200
+        self.bout_log = QPlainTextEdit()
+        self.bout_log.setObjectName("bout_log")
+        self.bout_log.setReadOnly(True)
+        self.bout_log.setMaximumBlockCount(200)
         self.bout_log.setMaximumHeight(150)
         log_layout.addWidget(self.bout_log)
         center_layout.addWidget(log_group)
@@ -470,10 +513,8 @@ class ScoringScreen(QWidget):
         content.addLayout(center_layout)
 
         # Player 2 score
-        p2_frame = self._create_player_frame("player2")
-        self.p2_name_label = p2_frame.findChild(QLabel, "player_name")
-        self.p2_score_label = p2_frame.findChild(QLabel, "player_score")
-        self.p2_stats_label = p2_frame.findChild(QLabel, "player_stats")
+        p2_frame, self.p2_name_label, self.p2_score_label, self.p2_stats_label = \
+            self._create_player_frame("player2")
         content.addWidget(p2_frame)
 
         layout.addLayout(content)
@@ -516,14 +557,14 @@ class ScoringScreen(QWidget):
         # Home team substitution
         home_sub_layout = QVBoxLayout()
         self.home_sub_label = QLabel("Home Team: 5 subs remaining")
-        self.home_sub_label.setStyleSheet("font-size: 9pt; color: #2196F3;")
+        self.home_sub_label.setObjectName("home_sub_label")
         home_sub_layout.addWidget(self.home_sub_label)
 
         self.btn_home_sub = QPushButton("Home Substitution")
         self.btn_home_sub.setIcon(icon_substitution())
         self.btn_home_sub.setIconSize(QSize(icon_sz, icon_sz))
-        self.btn_home_sub.setStyleSheet("font-size: 9pt; padding: 8px 16px;")
-        self.btn_home_sub.clicked.connect(lambda: self._open_substitution_dialog("home"))
+        self.btn_home_sub.setObjectName("substitution_button")
+        self.btn_home_sub.clicked.connect(self._open_home_substitution)
         home_sub_layout.addWidget(self.btn_home_sub)
 
         team_layout.addLayout(home_sub_layout)
@@ -533,12 +574,12 @@ class ScoringScreen(QWidget):
         # Game/Round info for team mode
         game_info_layout = QVBoxLayout()
         self.game_label = QLabel("GAME 1 / 3")
-        self.game_label.setStyleSheet("font-size: 11pt; font-weight: bold; color: #E8B923;")
+        self.game_label.setObjectName("game_label")
         self.game_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         game_info_layout.addWidget(self.game_label)
 
         self.elimination_label = QLabel("Eliminations: Home 0 - Away 0")
-        self.elimination_label.setStyleSheet("font-size: 9pt; color: #A0A0B0;")
+        self.elimination_label.setObjectName("elimination_label")
         self.elimination_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         game_info_layout.addWidget(self.elimination_label)
 
@@ -549,14 +590,14 @@ class ScoringScreen(QWidget):
         # Away team substitution
         away_sub_layout = QVBoxLayout()
         self.away_sub_label = QLabel("Away Team: 5 subs remaining")
-        self.away_sub_label.setStyleSheet("font-size: 9pt; color: #FF5722;")
+        self.away_sub_label.setObjectName("away_sub_label")
         away_sub_layout.addWidget(self.away_sub_label)
 
         self.btn_away_sub = QPushButton("Away Substitution")
         self.btn_away_sub.setIcon(icon_substitution())
         self.btn_away_sub.setIconSize(QSize(icon_sz, icon_sz))
-        self.btn_away_sub.setStyleSheet("font-size: 9pt; padding: 8px 16px;")
-        self.btn_away_sub.clicked.connect(lambda: self._open_substitution_dialog("away"))
+        self.btn_away_sub.setObjectName("substitution_button")
+        self.btn_away_sub.clicked.connect(self._open_away_substitution)
         away_sub_layout.addWidget(self.btn_away_sub)
 
         team_layout.addLayout(away_sub_layout)
@@ -564,8 +605,12 @@ class ScoringScreen(QWidget):
         layout.addWidget(self.team_controls)
         self.team_controls.setVisible(False)  # Hidden by default, shown for Team mode
 
-    def _create_player_frame(self, player_id: str) -> QFrame:
-        """Create a player score display frame (styled via QSS #player_card)."""
+    def _create_player_frame(self, player_id: str) -> tuple[QFrame, QLabel, QLabel, QLabel]:
+        """
+        Create a player score display frame (styled via QSS #player_card).
+
+        Returns (frame, name label, score label, stats label).
+        """
         frame = QFrame()
         frame.setObjectName("player_card")
 
@@ -592,7 +637,7 @@ class ScoringScreen(QWidget):
         stats_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(stats_label)
 
-        return frame
+        return frame, name_label, score_label, stats_label
 
     def _setup_shortcuts(self) -> None:
         """
@@ -608,44 +653,21 @@ class ScoringScreen(QWidget):
         - F: Open foul dialog
         - Ctrl+E: End round
         """
-        # O - Record OPA (instant, one key)
-        QShortcut(QKeySequence("O"), self).activated.connect(
-            self.scoring_panel.record_opa
-        )
+        for keys, slot in self._SHORTCUTS:
+            self._add_shortcut(keys, attrgetter(slot)(self))
 
-        # S - Record OSHI (instant, one key)
-        QShortcut(QKeySequence("S"), self).activated.connect(
-            self.scoring_panel.record_oshi
-        )
-
-        # Ctrl+Z - Undo
-        QShortcut(QKeySequence("Ctrl+Z"), self).activated.connect(
-            self._undo_last_bout
-        )
-
-        # Space - Pause/Resume
-        QShortcut(QKeySequence(Qt.Key.Key_Space), self).activated.connect(
-            self._toggle_pause
-        )
-
-        # F - Foul
-        QShortcut(QKeySequence("F"), self).activated.connect(
-            self.scoring_panel._open_foul_dialog
-        )
-
-        # Ctrl+E - End round
-        QShortcut(QKeySequence("Ctrl+E"), self).activated.connect(
-            self._end_round
-        )
-
-    def _connect_signals(self) -> None:
-        """Connect event bus signals."""
-        self.event_bus.timer_tick.connect(self._on_timer_tick)
-        self.event_bus.timer_expired.connect(self._on_timer_expired)
+    def _add_shortcut(self, keys: QKeySequence, slot) -> QShortcut:
+        """Create a shortcut that is only matched while focus is inside this screen."""
+        shortcut = QShortcut(keys, self)
+        shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        shortcut.activated.connect(slot)
+        return shortcut
 
     def set_scoring_engine(self, engine: ScoringEngine) -> None:
         """Set the active scoring engine."""
         self.scoring_engine = engine
+        self._id_pair = (engine._p1_id, engine._p2_id)
+        self._last_state = None
 
         # Determine game mode
         self._is_team_mode = engine.is_team_mode()
@@ -653,32 +675,32 @@ class ScoringScreen(QWidget):
         if self._is_team_mode:
             # Team mode: NO countdown timer - track elapsed time instead
             self.round_timer = None
-            self.timer_label.setText("00:00")  # Start at 0, count UP
-            self.timer_label.setStyleSheet(
-                "font-size: 32pt; font-weight: bold; font-family: 'JetBrains Mono', monospace; color: #00CC00;"
-            )
+            self._set_timer_text("00:00")  # Start at 0, count UP
+            self._set_timer_zone("green")
         else:
-            # 1v1 mode: Use countdown timer (60 seconds)
+            # 1v1 mode: Use countdown timer (60 seconds). This timer is the
+            # screen's only tick source; event_bus.timer_tick is not subscribed
             self.round_timer = RoundTimer()
             self.round_timer.tick.connect(self._on_timer_tick)
             self.round_timer.round_expired.connect(self._on_timer_expired)
-            self.timer_label.setText("01:00")
-
-        # Connect engine signals
-        engine.score_updated.connect(self._on_score_updated)
-        engine.bout_recorded.connect(self._on_bout_logged)
+            self._set_timer_text("01:00")
+
+        # Connect engine signals. Score and bout updates are queued so bursts
+        # render from the event loop; round/match transitions stay direct
+        # because round-end eliminations must land before the match completes
+        queued = Qt.ConnectionType.QueuedConnection
+        engine.score_updated.connect(self._on_score_updated, queued)
+        engine.bout_recorded.connect(self._on_bout_logged, queued)
         engine.round_started.connect(self._on_round_started)
         engine.round_ended.connect(self._on_round_ended)
         engine.match_completed.connect(self._on_match_completed)
 
-        # Update UI with initial state
-        self._update_display(engine.get_score_state())
+        # Scores, names and team info are painted on the next event-loop pass,
+        # so the screen accepts input before its first full repaint
+        QTimer.singleShot(0, self._initial_paint)
 
-        # Set player names on display
-        self.p1_name_label.setText(engine._p1_name)
-        self.p2_name_label.setText(engine._p2_name)
-
-        # Set toss result on scoring panel for one-click recording
+        # Set toss result on scoring panel for one-click recording (kept
+        # synchronous: O/S shortcuts need the player IDs right away)
         # The engine now has opa_player_id and oshi_player_id properties
         self.scoring_panel.set_toss_result(
             opa_player_id=engine.opa_player_id,
@@ -690,7 +712,6 @@ class ScoringScreen(QWidget):
         # Show/hide team controls based on game mode
         if self._is_team_mode:
             self.team_controls.setVisible(True)
-            self._update_team_display()
 
             # Connect team mode signals
             engine.substitution_made.connect(self._on_substitution_made)
@@ -699,6 +720,37 @@ class ScoringScreen(QWidget):
         else:
             self.team_controls.setVisible(False)
 
+    @Slot()
+    def _initial_paint(self) -> None:
+        """Render the active engine's initial scores, names and team info."""
+        engine = self.scoring_engine
+        if not engine:
+            return
+
+        # Update UI with initial state (also refreshes the team display)
+        self._update_display(engine.get_score_state())
+
+        # Set player names on display
+        self.p1_name_label.setText(engine._p1_name)
+        self.p2_name_label.setText(engine._p2_name)
+
+        self._take_focus()
+
+    @Slot()
+    def _take_focus(self) -> None:
+        """Focus the screen so its scoring shortcuts are live."""
+        self.setFocus(Qt.FocusReason.OtherFocusReason)
+
+    @Slot()
+    def _open_home_substitution(self) -> None:
+        """Open the substitution dialog for the home team."""
+        self._open_substitution_dialog("home")
+
+    @Slot()
+    def _open_away_substitution(self) -> None:
+        """Open the substitution dialog for the away team."""
+        self._open_substitution_dialog("away")
+
     def _open_substitution_dialog(self, team: str) -> None:
         """Open the substitution dialog for a team."""
         if not self.scoring_engine or not self.scoring_engine.is_team_mode():
@@ -814,7 +866,8 @@ class ScoringScreen(QWidget):
         - winner_id: Player ID who won
         - loser_id: Player ID who lost
         """
-        if not self.scoring_engine:
+        engine = self.scoring_engine
+        if not engine:
             QMessageBox.warning(
                 self,
                 "No Active Match",
@@ -822,9 +875,9 @@ class ScoringScreen(QWidget):
             )
             return
 
-        if not self.scoring_engine.can_record_bout:
+        if not engine.can_record_bout:
             # Provide helpful feedback about why bout can't be recorded
-            state = self.scoring_engine.state
+            state = engine.state
             if state == MatchState.MATCH_ACTIVE or state == MatchState.ROUND_COMPLETE:
                 QMessageBox.warning(
                     self,
@@ -853,29 +906,39 @@ class ScoringScreen(QWidget):
 
         result = data["result"]
         winner_id = data["winner_id"]
-        loser_id = data["loser_id"]
+        timer = self.round_timer
+        time_ms = timer.remaining_ms if timer else 0
 
         if self._is_team_mode:
             # Team mode: use record_team_bout so queues advance and AP/undo work correctly
-            winning_team = "home" if winner_id == self.scoring_engine._p1_id else "away"
-            time_ms = self.round_timer.remaining_ms if self.round_timer else 0
-            self.scoring_engine.record_team_bout(result, winning_team, time_ms)
+            winning_team = "home" if winner_id == self._id_pair[0] else "away"
+            engine.record_team_bout(result, winning_team, time_ms)
         else:
             # 1v1 mode: pass time remaining
-            time_value = self.round_timer.remaining_ms if self.round_timer else 0
-            self.scoring_engine.record_bout(result, winner_id, loser_id, time_value)
-            if self.round_timer:
-                self.round_timer.notify_bout_activity()
+            engine.record_bout(result, winner_id, data["loser_id"], time_ms)
+            if timer:
+                timer.notify_bout_activity()
 
+    @Slot()
     def _undo_last_bout(self) -> None:
         """Undo the last recorded bout."""
         if self.scoring_engine:
             undone = self.scoring_engine.undo_last_bout()
             if undone:
                 # Remove from log
-                if self.bout_log.count() > 0:
-                    self.bout_log.takeItem(self.bout_log.count() - 1)
+                self._flush_bout_log()
+                document = self.bout_log.document()
+                if document.blockCount() <= 1:
+                    # Removing the only block would leave an empty line behind
+                    document.clear()
+                else:
+                    # The newest bout is the last block
+                    cursor = QTextCursor(document)
+                    cursor.movePosition(QTextCursor.MoveOperation.End)
+                    cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
+                    cursor.removeSelectedText()
 
+    @Slot()
     def _start_round(self) -> None:
         """Start a new round."""
         if not self.scoring_engine or not self.scoring_engine.can_start_round:
@@ -898,7 +961,27 @@ class ScoringScreen(QWidget):
         self.btn_end_round.setEnabled(True)
 
         # Clear bout log for new round
-        self.bout_log.clear()
+        self._pending_log_items.clear()
+        with self._bulk_log():
+            self.bout_log.clear()
+
+    @contextmanager
+    def _bulk_log(self) -> Iterator[None]:
+        """Suspend bout log repaints while it is changed several times."""
+        self.bout_log.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.bout_log.setUpdatesEnabled(True)
+
+    def _flush_bout_log(self) -> None:
+        """Append pending bout log lines with a single repaint."""
+        if not self._pending_log_items:
+            return
+        with self._bulk_log():
+            for line in self._pending_log_items:
+                self.bout_log.appendHtml(line)
+        self._pending_log_items.clear()
 
     def _start_elapsed_timer(self) -> None:
         """Start the elapsed time timer for team mode (ticks every second)."""
@@ -917,10 +1000,9 @@ class ScoringScreen(QWidget):
         if self._is_team_mode and self._round_start_time is not None:
             import time
             elapsed = time.time() - self._round_start_time
-            minutes = int(elapsed) // 60
-            seconds = int(elapsed) % 60
-            self.timer_label.setText(f"{minutes:02d}:{seconds:02d}")
+            self._set_timer_text(self._format_mmss(int(elapsed)))
 
+    @Slot()
     def _toggle_pause(self) -> None:
         """Toggle pause state."""
         if not self.scoring_engine:
@@ -949,6 +1031,7 @@ class ScoringScreen(QWidget):
                 self.round_timer.pause()
             self.btn_pause.setText("Resume")
 
+    @Slot()
     def _end_round(self) -> None:
         """End the current round."""
         if not self.scoring_engine:
@@ -962,6 +1045,7 @@ class ScoringScreen(QWidget):
                 self.round_timer.stop()
             self.scoring_engine.end_round()
 
+    @Slot()
     def _end_match(self) -> None:
         """End the match early."""
         if not self.scoring_engine:
@@ -987,25 +1071,51 @@ class ScoringScreen(QWidget):
 
     @Slot(int)
     def _on_timer_tick(self, remaining_ms: int) -> None:
-        """Handle timer tick."""
-        minutes = remaining_ms // 60000
-        seconds = (remaining_ms % 60000) // 1000
+        """Handle timer tick; the label is refreshed by the flush timer."""
+        self._pending_ms = remaining_ms
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-        self.timer_label.setText(f"{minutes:02d}:{seconds:02d}")
+    @Slot()
+    def _flush_timer_label(self) -> None:
+        """Render the latest tick, stopping once ticks have stopped arriving."""
+        remaining_ms = self._pending_ms
+        if remaining_ms is None:
+            self._flush_timer.stop()
+            return
+        self._pending_ms = None
+
+        self._set_timer_text(self._format_mmss(remaining_ms // 1000))
 
         # Color changes for warnings
         if remaining_ms < 10000:
-            self.timer_label.setStyleSheet(
-                "font-size: 32pt; font-weight: bold; font-family: 'JetBrains Mono', monospace; color: #FF4444;"
-            )
+            self._set_timer_zone("red")
         elif remaining_ms < 30000:
-            self.timer_label.setStyleSheet(
-                "font-size: 32pt; font-weight: bold; font-family: 'JetBrains Mono', monospace; color: #FFB74D;"
-            )
+            self._set_timer_zone("amber")
         else:
-            self.timer_label.setStyleSheet(
-                "font-size: 32pt; font-weight: bold; font-family: 'JetBrains Mono', monospace; color: #00CC00;"
-            )
+            self._set_timer_zone("green")
+
+    def _format_mmss(self, total_seconds: int) -> str:
+        """Return "MM:SS" text, from the precomputed table when in range."""
+        if total_seconds < len(self._MMSS):
+            return self._MMSS[total_seconds]
+        return f"{total_seconds // 60:02d}:{total_seconds % 60:02d}"
+
+    def _set_timer_text(self, text: str) -> None:
+        """Set the timer label text, skipping the label if unchanged."""
+        if text != self._last_time_str:
+            self._last_time_str = text
+            self.timer_label.setText(text)
+
+    def _set_timer_zone(self, zone: str) -> None:
+        """Apply the "green", "amber" or "red" timer color on zone changes only."""
+        if zone != self._timer_zone:
+            self._timer_zone = zone
+            # Re-polish so the matching QLabel#timer_display[zone] rule applies
+            label = self.timer_label
+            label.setProperty("zone", zone)
+            label.style().unpolish(label)
+            label.style().polish(label)
 
     @Slot()
     def _on_timer_expired(self) -> None:
@@ -1018,21 +1128,33 @@ class ScoringScreen(QWidget):
         self._update_display(state)
 
     def _update_display(self, state: ScoreState) -> None:
-        """Update all display elements."""
+        """Update all display elements, re-rendering only labels whose fields changed."""
+        last = self._last_state
+
         # Round info
-        self.round_label.setText(f"ROUND {state.current_round} / {state.total_rounds}")
+        if (last is None or state.current_round != last.current_round
+                or state.total_rounds != last.total_rounds):
+            self.round_label.setText(f"ROUND {state.current_round} / {state.total_rounds}")
 
         # Player 1
-        self.p1_score_label.setText(str(state.player1_ap))
-        self.p1_stats_label.setText(
-            f"Opa: {state.player1_opa_wins} | Oshi: {state.player1_oshi_wins}"
-        )
+        if last is None or state.player1_ap != last.player1_ap:
+            self.p1_score_label.setNum(state.player1_ap)
+        if (last is None or state.player1_opa_wins != last.player1_opa_wins
+                or state.player1_oshi_wins != last.player1_oshi_wins):
+            self.p1_stats_label.setText(
+                f"Opa: {state.player1_opa_wins} | Oshi: {state.player1_oshi_wins}"
+            )
 
         # Player 2
-        self.p2_score_label.setText(str(state.player2_ap))
-        self.p2_stats_label.setText(
-            f"Opa: {state.player2_opa_wins} | Oshi: {state.player2_oshi_wins}"
-        )
+        if last is None or state.player2_ap != last.player2_ap:
+            self.p2_score_label.setNum(state.player2_ap)
+        if (last is None or state.player2_opa_wins != last.player2_opa_wins
+                or state.player2_oshi_wins != last.player2_oshi_wins):
+            self.p2_stats_label.setText(
+                f"Opa: {state.player2_opa_wins} | Oshi: {state.player2_oshi_wins}"
+            )
+
+        self._last_state = state
 
         # Update button states based on match state
         self.btn_start_round.setEnabled(
@@ -1055,7 +1177,7 @@ class ScoringScreen(QWidget):
             if self._is_team_mode and bout_data.get("winning_team"):
                 winner_name = (self.scoring_engine._p1_name if bout_data["winning_team"] == "home"
                                else self.scoring_engine._p2_name)
-            elif winner_id == self.scoring_engine._p1_id:
+            elif winner_id == self._id_pair[0]:
                 winner_name = self.scoring_engine._p1_name
             else:
                 winner_name = self.scoring_engine._p2_name
@@ -1072,14 +1194,14 @@ class ScoringScreen(QWidget):
             # 1v1 mode: show time remaining
             time_str = f"{time_ms // 1000}s left" if time_ms else ""
 
-        item = QListWidgetItem(f"#{bout_data['bout']} {result} → {winner_name} ({time_str})")
+        text = html.escape(f"#{bout_data['bout']} {result} → {winner_name} ({time_str})")
+        color = "#00FF00" if result == "OPA" else "#FF0000"
+        line = f'<span style="color:{color}">{text}</span>'
 
-        if result == "OPA":
-            item.setForeground(Qt.GlobalColor.green)
-        else:
-            item.setForeground(Qt.GlobalColor.red)
-
-        self.bout_log.insertItem(0, item)
+        # Bouts arriving in a burst are appended together on the next pass
+        if not self._pending_log_items:
+            QTimer.singleShot(0, self._flush_bout_log)
+        self._pending_log_items.append(line)
 
     @Slot(int)
     def _on_round_started(self, round_num: int) -> None:
@@ -1096,17 +1218,16 @@ class ScoringScreen(QWidget):
         self.btn_pause.setText("Pause")
         self.btn_end_round.setEnabled(False)
 
-        # Reset timer display based on mode
+        # Reset timer display based on mode (dropping any unrendered tick)
+        self._pending_ms = None
         if self._is_team_mode:
             # Team mode: reset to 00:00 for next round (elapsed timer)
             self._round_start_time = None
-            self.timer_label.setText("00:00")
+            self._set_timer_text("00:00")
         else:
             # 1v1 mode: reset to 01:00 countdown
-            self.timer_label.setText("01:00")
-        self.timer_label.setStyleSheet(
-            "font-size: 32pt; font-weight: bold; font-family: 'JetBrains Mono', monospace; color: #00CC00;"
-        )
+            self._set_timer_text("01:00")
+        self._set_timer_zone("green")
 
         # Show round result with actual player/team name
         if winner == "player1":
@@ -1143,8 +1264,7 @@ class ScoringScreen(QWidget):
                     # Eliminate the player and get bonus AP
                     bonus_ap = self.scoring_engine.eliminate_player(eliminated_id, losing_team)
 
-                    QMessageBox.information(
-                        self,
+                    self._show_transition(
                         f"Round {round_num} Complete",
                         f"Round winner: {winner_text}\n\n"
                         f"Eliminated: {eliminated_name}\n"
@@ -1152,27 +1272,41 @@ class ScoringScreen(QWidget):
                     )
                 else:
                     # Dialog was closed without selection - still need to show result
-                    QMessageBox.information(
-                        self,
+                    self._show_transition(
                         f"Round {round_num} Complete",
                         f"Round winner: {winner_text}\n\n"
                         "(No elimination selected)"
                     )
             else:
                 # No players left to eliminate
-                QMessageBox.information(
-                    self,
+                self._show_transition(
                     f"Round {round_num} Complete",
                     f"Round winner: {winner_text}"
                 )
         else:
             # 1v1 mode or tie - simple message
-            QMessageBox.information(
-                self,
+            self._show_transition(
                 f"Round {round_num} Complete",
                 f"Round winner: {winner_text}"
             )
 
+    def _show_transition(self, title: str, text: str) -> None:
+        """
+        Show a round/match result without blocking the event loop.
+
+        The box is non-modal and shown on the next pass, so timer ticks and
+        bout input keep flowing while it is on screen.
+        """
+        box = QMessageBox(
+            QMessageBox.Icon.Information, title, text,
+            QMessageBox.StandardButton.Ok, self,
+        )
+        box.setModal(False)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        # The box takes focus while open; hand it back so shortcuts work again
+        box.finished.connect(self._take_focus)
+        QTimer.singleShot(0, box.show)
+
     @Slot(dict)
     def _on_match_completed(self, results: dict) -> None:
         """Handle match completion."""
@@ -1191,8 +1325,7 @@ class ScoringScreen(QWidget):
         else:
             winner_text = "Tie"
 
-        QMessageBox.information(
-            self,
+        self._show_transition(
             "Match Complete",
             f"Winner: {winner_text}\n\nFinal Score:\n{p1_name}: {p1_ap} AP\n{p2_name}: {p2_ap} AP"
         )
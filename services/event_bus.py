@@ -5,7 +5,7 @@ All modules connect to this single object rather than directly to each other,
 enabling loose coupling between the scoring engine, GUI, and camera systems.
 """
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QMetaMethod
 
 
 class EventBus(QObject):
@@ -81,6 +81,14 @@ class EventBus(QObject):
     def __init__(self):
         super().__init__()
 
+    def has_listeners(self, signal) -> bool:
+        """Check whether any slot is connected to one of this bus's signals.
+
+        Lets emitters skip building a payload nobody will receive, e.g.
+        ``if bus.has_listeners(bus.match_created): bus.match_created.emit({...})``.
+        """
+        return self.isSignalConnected(QMetaMethod.fromSignal(signal))
+
     def emit_score_update(self, score_update) -> None:
         """Convenience method to emit a score update."""
         self.score_updated.emit(score_update)
@@ -0,0 +1,169 @@
+"""
+Unit tests for the Match Setup wizard helpers.
+
+Tests cover the players/teams step validation and the roster table model.
+"""
+
+import pytest
+from PySide6.QtCore import Qt
+
+from gui.widgets.match_setup import RosterTableModel, _players_step_error
+from models.match import GameMode
+
+
+def _tournament_names(count: int = 16) -> tuple[str, ...]:
+    """Build a tournament input tuple with `count` filled names out of 16."""
+    return tuple(f"Team {i}" if i <= count else "" for i in range(1, 17))
+
+
+class TestPlayersStepError:
+    """Tests for _players_step_error validation."""
+
+    def setup_method(self):
+        """Start each test with an empty validation cache."""
+        _players_step_error.cache_clear()
+
+    def test_1v1_valid_names_pass(self):
+        """Two entered player names should pass."""
+        assert _players_step_error(GameMode.ONE_VS_ONE, ("Ama", "Esi")) is None
+
+    @pytest.mark.parametrize("names", [("", "Esi"), ("Ama", ""), ("", "")])
+    def test_1v1_empty_name_rejected(self, names):
+        """A blank player name (callers pass names stripped) should be rejected."""
+        error = _players_step_error(GameMode.ONE_VS_ONE, names)
+        assert error is not None
+        assert error[0] == "Missing Information"
+
+    def test_1v1_whitespace_name_rejected(self):
+        """A whitespace-only name is stripped to empty by the wizard and rejected."""
+        error = _players_step_error(GameMode.ONE_VS_ONE, ("Ama", "   ".strip()))
+        assert error is not None
+        assert error[0] == "Missing Information"
+
+    def test_team_valid_rosters_pass(self):
+        """Two named teams with 15 players each should pass."""
+        inputs = ("Home", "Away", 15, 15)
+        assert _players_step_error(GameMode.TEAM_VS_TEAM, inputs) is None
+
+    def test_team_missing_name_rejected(self):
+        """A team without a name should be rejected."""
+        error = _players_step_error(GameMode.TEAM_VS_TEAM, ("Home", "", 15, 15))
+        assert error[0] == "Missing Information"
+
+    def test_team_incomplete_roster_reports_counts(self):
+        """A short roster should be rejected with both player counts."""
+        error = _players_step_error(GameMode.TEAM_VS_TEAM, ("Home", "Away", 15, 12))
+        assert error[0] == "Incomplete Rosters"
+        assert "Home team: 15/15" in error[1]
+        assert "Away team: 12/15" in error[1]
+
+    def test_tournament_valid_names_pass(self):
+        """Sixteen unique team names should pass."""
+        assert _players_step_error(GameMode.TOURNAMENT, _tournament_names()) is None
+
+    def test_tournament_empty_names_rejected(self):
+        """Blank slots should count as missing teams."""
+        error = _players_step_error(GameMode.TOURNAMENT, _tournament_names(14))
+        assert error[0] == "Incomplete Teams"
+        assert "14/16" in error[1]
+
+    def test_tournament_duplicate_names_rejected(self):
+        """Repeated team names should be rejected."""
+        names = _tournament_names()[:-1] + ("Team 1",)
+        error = _players_step_error(GameMode.TOURNAMENT, names)
+        assert error[0] == "Duplicate Names"
+
+    def test_cache_reuses_result_for_same_inputs(self):
+        """Re-checking unchanged inputs should be served from the cache."""
+        inputs = ("Home", "Away", 15, 12)
+        first = _players_step_error(GameMode.TEAM_VS_TEAM, inputs)
+        second = _players_step_error(GameMode.TEAM_VS_TEAM, inputs)
+
+        assert second == first
+        assert _players_step_error.cache_info().hits == 1
+
+    def test_cache_key_covers_every_input(self):
+        """Changing any single input should produce a fresh check."""
+        base = ("Home", "Away", 15, 15)
+        assert _players_step_error(GameMode.TEAM_VS_TEAM, base) is None
+
+        for position, changed in enumerate(("", "", 14, 14)):
+            inputs = base[:position] + (changed,) + base[position + 1:]
+            assert _players_step_error(GameMode.TEAM_VS_TEAM, inputs) is not None
+
+        assert _players_step_error.cache_info().hits == 0
+
+    def test_cache_key_includes_mode(self):
+        """The same names under a different mode should not share a result."""
+        assert _players_step_error(GameMode.ONE_VS_ONE, ("Ama", "")) is not None
+        assert _players_step_error(GameMode.TOURNAMENT, ("Ama", "")) is not None
+        assert _players_step_error.cache_info().hits == 0
+
+
+class TestRosterTableModel:
+    """Tests for RosterTableModel."""
+
+    def setup_method(self):
+        """Set up a three-box roster with one blank and one whitespace name."""
+        self.model = RosterTableModel(["Ama", "", "  "], [1, 2, 3])
+
+    def test_shape(self):
+        """One row per box and two columns."""
+        assert self.model.rowCount() == 3
+        assert self.model.columnCount() == 2
+
+    def test_filled_count_ignores_blank_names(self):
+        """Empty and whitespace-only names should not count as filled."""
+        assert self.model.filled_count == 1
+
+    def test_data_returns_name_and_jersey(self):
+        """Display and edit roles should return the stored values."""
+        name_index = self.model.index(0, RosterTableModel.NAME_COLUMN)
+        jersey_index = self.model.index(0, RosterTableModel.JERSEY_COLUMN)
+
+        assert self.model.data(name_index) == "Ama"
+        assert self.model.data(name_index, Qt.ItemDataRole.EditRole) == "Ama"
+        assert self.model.data(jersey_index) == 1
+        assert self.model.data(name_index, Qt.ItemDataRole.ToolTipRole) is None
+
+    def test_set_name_updates_filled_count(self):
+        """Filling and clearing names should keep filled_count in step."""
+        index = self.model.index(1, RosterTableModel.NAME_COLUMN)
+
+        assert self.model.setData(index, "Esi")
+        assert self.model.names[1] == "Esi"
+        assert self.model.filled_count == 2
+
+        self.model.setData(index, "   ")
+        assert self.model.filled_count == 1
+
+    def test_set_jersey_stores_int(self):
+        """Jersey edits should be stored as integers without touching names."""
+        index = self.model.index(2, RosterTableModel.JERSEY_COLUMN)
+
+        assert self.model.setData(index, "7")
+        assert self.model.jerseys[2] == 7
+        assert self.model.filled_count == 1
+
+    def test_set_data_rejects_non_edit_role(self):
+        """Only the edit role should change the model."""
+        index = self.model.index(1, RosterTableModel.NAME_COLUMN)
+
+        assert not self.model.setData(index, "Esi", Qt.ItemDataRole.DisplayRole)
+        assert self.model.names[1] == ""
+
+    def test_set_data_emits_data_changed(self):
+        """Edits should notify views of the changed cell."""
+        changed = []
+        self.model.dataChanged.connect(lambda top, bottom, roles: changed.append(top.row()))
+
+        self.model.setData(self.model.index(1, RosterTableModel.NAME_COLUMN), "Esi")
+        assert changed == [1]
+
+    def test_reset_rows_recounts_filled(self):
+        """Replacing the rows should recompute filled_count."""
+        self.model.reset_rows(["A", "B", "C"], [4, 5, 6])
+
+        assert self.model.names == ["A", "B", "C"]
+        assert self.model.jerseys == [4, 5, 6]
+        assert self.model.filled_count == 3
@@ -249,6 +249,20 @@ class TestScoringEngine1v1:
         assert state.bout_count == 2
         assert state.is_round_active
 
+    def test_configure_toss_sets_opa_player(self):
+        """Toss winner choosing OSHI should give OPA to the opponent."""
+        self.engine.configure_toss("player1", "oshi")
+
+        assert self.engine.opa_player_id == 2
+        assert self.engine.oshi_player_id == 1
+
+    def test_configure_toss_rejects_unknown_values(self):
+        """Unknown toss winners or choices should be rejected."""
+        with pytest.raises(ValueError):
+            self.engine.configure_toss("player3", "opa")
+        with pytest.raises(ValueError):
+            self.engine.configure_toss("player1", "both")
+
 
 class TestScoringEngineTeamMode:
     """Tests for Team vs Team mode scoring."""
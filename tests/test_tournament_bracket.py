@@ -99,6 +99,15 @@ class TestTournamentBracketSetup:
         with pytest.raises(ValueError):
             bracket.initialize_tournament(teams, num_groups=4, teams_per_group=4)
 
+    def test_save_blocked_while_initial_save_pending(self):
+        """Test that save_to_db refuses to create a second record mid-save."""
+        bracket = TournamentBracket()
+        bracket.save_pending = True
+
+        with pytest.raises(RuntimeError):
+            bracket.save_to_db(session=None)
+        assert bracket.tournament_id is None
+
 
 class TestGroupStage:
     """Tests for group stage functionality."""